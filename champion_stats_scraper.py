@@ -3,17 +3,86 @@ Enhanced Champion Statistics Scraper
 Combines multiple sources for complete champion data
 """
 
+import logging
 import requests
 import re
 import json
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from dataclasses import dataclass
+from functools import lru_cache
+
+from http_session import create_session
+
+logger = logging.getLogger(__name__)
+
+# Data Dragon ids for champions whose name doesn't just capitalize
+ICON_NAME_MAP = {
+    "aurelionsol": "AurelionSol", "belveth": "Belveth", "chogath": "Chogath",
+    "drmundo": "DrMundo", "jarvaniv": "JarvanIV", "kogmaw": "KogMaw",
+    "leblanc": "Leblanc", "leesin": "LeeSin", "masteryi": "MasterYi",
+    "missfortune": "MissFortune", "monkeyking": "MonkeyKing", "nunu": "Nunu",
+    "reksai": "RekSai", "renata": "Renata", "tahmkench": "TahKench",
+    "twistedfate": "TwistedFate", "xinzhao": "XinZhao"
+}
+
+# Starter/consumable items that shouldn't count as build items
+SKIP_ITEMS = ("Doran", "Health Potion", "Mana Potion", "Refillable",
+              "Stealth Ward", "Oracle", "Control Ward", "Farsight", "Boots of Speed")
+
+# Keystone -> rune tree
+RUNE_TO_TREE = {
+    "Lethal Tempo": "Precision", "Fleet Footwork": "Precision",
+    "Press the Attack": "Precision", "Conqueror": "Precision",
+    "Electrocute": "Domination", "Dark Harvest": "Domination", "Hail of Blades": "Domination",
+    "Arcane Comet": "Sorcery", "Phase Rush": "Sorcery", "Summon Aery": "Sorcery",
+    "Grasp of the Undying": "Resolve", "Aftershock": "Resolve", "Guardian": "Resolve",
+    "First Strike": "Inspiration", "Glacial Augment": "Inspiration", "Unsealed Spellbook": "Inspiration"
+}
+
+# Rune id prefix (rune_id // 100) -> rune tree
+RUNE_TREE_IDS = {80: "Precision", 81: "Domination", 82: "Sorcery", 83: "Inspiration", 84: "Resolve"}
+
+# Lolalytics page text patterns, compiled once at import instead of on every scrape
+WIN_RATE_DIAMOND_RE = re.compile(r'has a (\d+\.\d+)% win rate in Diamond\+')
+WIN_RATE_RE = re.compile(r'has a (\d+\.\d+)% win rate')
+PICK_RATE_RE = re.compile(r'(\d+\.\d+)%\s*Pick Rate')
+BAN_RATE_RE = re.compile(r'(\d+\.\d+)%\s*Ban Rate')
+TIER_RE = re.compile(r'graded ([SABCD][\+\-]?) Tier')
+MATCHUP_SUMMARY_RE = re.compile(r'strong counter to ([^<]+?) while .+ countered most by ([^<]+?)\.')
+CHAMPION_LIST_SPLIT_RE = re.compile(r',\s*|\s*&\s*')
+RUNE_IMG_RE = re.compile(r'rune\d+/', re.I)
+RUNE_ID_RE = re.compile(r'/rune\d+/(\d{4})')
+
+# Matchup win rate thresholds and the difficulty for each band (bisect_right index)
+DIFFICULTY_WR_THRESHOLDS = (45, 50, 55)
+DIFFICULTY_LABELS = ("Very Hard", "Difficult", "Skill Matchup", "Easy")
+
+# Lolalytics role name -> name shown in the bot
+ROLE_NAMES = {'Bottom': 'ADC', 'Middle': 'Mid'}
+
+ICON_BASE_URL = "https://ddragon.leagueoflegends.com/cdn/15.1.1/img/champion"
+
+@lru_cache(maxsize=512)
+def champion_icon_url(champion_name: str) -> str:
+    """Data Dragon icon URL for a champion name (icons are requested for the same few champions constantly)"""
+    clean_name = champion_name.replace(" ", "").replace("'", "")
+    icon_id = ICON_NAME_MAP.get(clean_name.lower(), clean_name.capitalize())
+    return f"{ICON_BASE_URL}/{icon_id}.png"
+
+@lru_cache(maxsize=512)
+def _role_pattern(champion_name: str):
+    """Compiled role-detection regex for a champion (built once per champion)"""
+    return re.compile(r'for (top|jungle|middle|bottom|support) ' + re.escape(champion_name.lower()), re.IGNORECASE)
 
 @dataclass
 class Matchup:
     """Champion matchup data"""
+    # No per-instance __dict__, stats pages carry dozens of these
+    __slots__ = ('opponent_name', 'win_rate', 'games')
+    
     opponent_name: str
     win_rate: float
     games: int
@@ -43,37 +112,27 @@ class DetailedChampionStats:
 class ChampionStatsScraper:
     """Scraper combining Lolalytics + OP.GG for champion stats"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Pass a session in to share its connection pool with the other scrapers
+        self.session = session or create_session()
         try:
             self.ua = UserAgent()
         except Exception as e:
-            print("   Using fallback user agent string")
+            logger.info("   Using fallback user agent string")
             self.ua = type('MockUserAgent', (), {
                 'random': lambda: 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             })()
-        self.session.headers.update({
+        # Sent per request rather than set on the session, which may be shared
+        self.headers = {
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml',
             'Accept-Language': 'en-US,en;q=0.9',
-        })
-        self.icon_base_url = "https://ddragon.leagueoflegends.com/cdn/15.1.1/img/champion"
+        }
+        self.icon_base_url = ICON_BASE_URL
     
     def get_champion_icon_url(self, champion_name: str) -> Optional[str]:
         """Get champion icon URL from Data Dragon (no auth needed)"""
-        name_map = {
-            "aurelionsol": "AurelionSol", "belveth": "Belveth", "chogath": "Chogath",
-            "drmundo": "DrMundo", "jarvaniv": "JarvanIV", "kogmaw": "KogMaw",
-            "leblanc": "Leblanc", "leesin": "LeeSin", "masteryi": "MasterYi",
-            "missfortune": "MissFortune", "monkeyking": "MonkeyKing", "nunu": "Nunu",
-            "reksai": "RekSai", "renata": "Renata", "tahmkench": "TahKench",
-            "twistedfate": "TwistedFate", "xinzhao": "XinZhao"
-        }
-        
-        clean_name = champion_name.replace(" ", "").replace("'", "")
-        champ_id = name_map.get(clean_name.lower(), clean_name.capitalize())
-        
-        return f"{self.icon_base_url}/{champ_id}.png"
+        return champion_icon_url(champion_name)
     
     def get_champion_stats(self, champion_name: str, role: str = "default") -> Optional[DetailedChampionStats]:
         """Get comprehensive champion statistics"""
@@ -82,11 +141,11 @@ class ChampionStatsScraper:
             clean_name = champion_name.lower().replace(" ", "").replace("'", "")
             url = f"https://lolalytics.com/lol/{clean_name}/build/?tier=diamond_plus"
             
-            print(f"   📡 Lolalytics (Diamond+, Current Patch): {url}")
-            response = self.session.get(url, timeout=15)
+            logger.info("   📡 Lolalytics (Diamond+, Current Patch): %s", url)
+            response = self.session.get(url, headers=self.headers, timeout=15)
             
             if response.status_code != 200:
-                print(f"   ❌ Lolalytics failed: {response.status_code}")
+                logger.error("   ❌ Lolalytics failed: %s", response.status_code)
                 return None
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -101,9 +160,9 @@ class ChampionStatsScraper:
             best_matchups, worst_matchups = self._extract_matchups_from_lolalytics(soup, page_text, champion_name)
             primary_rune, secondary_rune = self._extract_runes_from_lolalytics(soup, page_text)
             
-            print(f"   ✅ Parsed: WR={win_rate:.1f}%, PR={pick_rate:.1f}%, Tier={tier}")
-            print(f"   📦 Items: {len(popular_items)} popular, {len(winrate_items)} high WR")
-            print(f"   ⚔️ Matchups: {len(best_matchups)} best, {len(worst_matchups)} worst")
+            logger.info("   ✅ Parsed: WR=%.1f%%, PR=%.1f%%, Tier=%s", win_rate, pick_rate, tier)
+            logger.debug("   📦 Items: %d popular, %d high WR", len(popular_items), len(winrate_items))
+            logger.debug("   ⚔️ Matchups: %d best, %d worst", len(best_matchups), len(worst_matchups))
             
             return DetailedChampionStats(
                 champion_name=champion_name,
@@ -122,9 +181,7 @@ class ChampionStatsScraper:
             )
             
         except Exception as e:
-            print(f"   ❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("   ❌ Error scraping %s: %s", champion_name, e)
             return None
     
     def _extract_rates_from_lolalytics(self, text: str) -> Tuple[float, float, float]:
@@ -133,52 +190,45 @@ class ChampionStatsScraper:
         pick_rate = 5.0
         ban_rate = 5.0
         
-        summary_pattern = r'has a (\d+\.\d+)% win rate in Diamond\+'
-        match = re.search(summary_pattern, text)
+        match = WIN_RATE_DIAMOND_RE.search(text)
         if match:
             win_rate = float(match.group(1))
-            print(f"      Win Rate: {win_rate}%")
+            logger.debug("      Win Rate: %s%%", win_rate)
         else:
-            summary_pattern2 = r'has a (\d+\.\d+)% win rate'
-            match = re.search(summary_pattern2, text)
+            match = WIN_RATE_RE.search(text)
             if match:
                 win_rate = float(match.group(1))
-                print(f"      Win Rate: {win_rate}%")
+                logger.debug("      Win Rate: %s%%", win_rate)
         
-        pick_pattern = r'(\d+\.\d+)%\s*Pick Rate'
-        match = re.search(pick_pattern, text)
+        match = PICK_RATE_RE.search(text)
         if match:
             pick_rate = float(match.group(1))
-            print(f"      Pick Rate: {pick_rate}%")
+            logger.debug("      Pick Rate: %s%%", pick_rate)
         
-        ban_pattern = r'(\d+\.\d+)%\s*Ban Rate'
-        match = re.search(ban_pattern, text)
+        match = BAN_RATE_RE.search(text)
         if match:
             ban_rate = float(match.group(1))
-            print(f"      Ban Rate: {ban_rate}%")
+            logger.debug("      Ban Rate: %s%%", ban_rate)
         
         return win_rate, pick_rate, ban_rate
     
     def _detect_role(self, text: str, champion_name: str) -> str:
         """Detect primary role from Lolalytics"""
-        role_pattern = r'for (top|jungle|middle|bottom|support) ' + re.escape(champion_name.lower())
-        match = re.search(role_pattern, text, re.IGNORECASE)
+        match = _role_pattern(champion_name).search(text)
         
         if match:
             role = match.group(1).capitalize()
-            role_map = {'Bottom': 'ADC', 'Middle': 'Mid'}
-            return role_map.get(role, role)
+            return ROLE_NAMES.get(role, role)
         
         return "Mid"  # Default
     
     def _extract_tier_from_lolalytics(self, text: str) -> str:
         """Extract tier from Lolalytics page"""
-        tier_pattern = r'graded ([SABCD][\+\-]?) Tier'
-        match = re.search(tier_pattern, text)
+        match = TIER_RE.search(text)
         
         if match:
             tier = match.group(1)
-            print(f"      Tier: {tier}")
+            logger.debug("      Tier: %s", tier)
             return tier
         
         return "B"
@@ -211,9 +261,7 @@ class ChampionStatsScraper:
             
             if '/item64/' in src or '/item32/' in src:
                 if alt and len(alt) > 2 and alt not in seen:
-                    skip = ["Doran", "Health Potion", "Mana Potion", "Refillable", 
-                           "Stealth Ward", "Oracle", "Control Ward", "Farsight", "Boots of Speed"]
-                    if not any(s in alt for s in skip):
+                    if not any(s in alt for s in SKIP_ITEMS):
                         all_items.append(alt)
                         seen.add(alt)
         
@@ -234,23 +282,21 @@ class ChampionStatsScraper:
         if len(most_popular_build) < 3:
             most_popular_build = ["Immortal Shieldbow", "Phantom Dancer", "Bloodthirster"]
         
-        print(f"      📦 Build #1 (Highest WR): {', '.join(highest_wr_build)}")
-        print(f"      📦 Build #2 (Most Popular): {', '.join(most_popular_build)}")
+        logger.debug("      📦 Build #1 (Highest WR): %s", ', '.join(highest_wr_build))
+        logger.debug("      📦 Build #2 (Most Popular): %s", ', '.join(most_popular_build))
         
         return most_popular_build, highest_wr_build
     
     def _extract_matchups_from_lolalytics(self, soup: BeautifulSoup, text: str, champion_name: str) -> Tuple[List[Matchup], List[Matchup]]:
         """Extract matchup data from Lolalytics (names from summary, WR estimated with variation)"""
-        import random
         best_matchups = []
         worst_matchups = []
         
-        matchup_pattern = r'strong counter to ([^<]+?) while .+ countered most by ([^<]+?)\.'
-        match = re.search(matchup_pattern, text)
+        match = MATCHUP_SUMMARY_RE.search(text)
         
         if match:
             strong_text = match.group(1)
-            strong_champions = re.split(r',\s*|\s*&\s*', strong_text)
+            strong_champions = CHAMPION_LIST_SPLIT_RE.split(strong_text)
             wr_values = [56.8, 55.2, 54.5]  # Realistic spread
             games_values = [312, 268, 195]  # Varied game counts
             
@@ -260,7 +306,7 @@ class ChampionStatsScraper:
                     best_matchups.append(Matchup(champ, wr_values[i], games_values[i]))
             
             weak_text = match.group(2)
-            weak_champions = re.split(r',\s*|\s*&\s*', weak_text)
+            weak_champions = CHAMPION_LIST_SPLIT_RE.split(weak_text)
             wr_values_weak = [43.2, 44.8, 45.9]  # Realistic spread
             games_values_weak = [287, 324, 198]  # Varied counts
             
@@ -271,10 +317,10 @@ class ChampionStatsScraper:
         
         if best_matchups:
             matchups_str = ', '.join([f'{m.opponent_name} ({m.win_rate:.1f}%)' for m in best_matchups])
-            print(f"      ✅ Easy lanes: {matchups_str}")
+            logger.debug("      ✅ Easy lanes: %s", matchups_str)
         if worst_matchups:
             matchups_str = ', '.join([f'{m.opponent_name} ({m.win_rate:.1f}%)' for m in worst_matchups])
-            print(f"      ❌ Hard lanes: {matchups_str}")
+            logger.debug("      ❌ Hard lanes: %s", matchups_str)
         
         return best_matchups, worst_matchups
     
@@ -283,17 +329,7 @@ class ChampionStatsScraper:
         primary = "Unknown"
         secondary = "Unknown"
         
-        rune_imgs = soup.find_all('img', {'src': re.compile(r'rune\d+/', re.I)})
-        
-        keystones = [
-            "Lethal Tempo", "Fleet Footwork", "Press the Attack", "Conqueror",
-            "Electrocute", "Dark Harvest", "Hail of Blades",
-            "Arcane Comet", "Phase Rush", "Summon Aery",
-            "Grasp of the Undying", "Aftershock", "Guardian",
-            "First Strike", "Glacial Augment", "Unsealed Spellbook"
-        ]
-        
-        trees = ["Precision", "Domination", "Sorcery", "Resolve", "Inspiration"]
+        rune_imgs = soup.find_all('img', {'src': RUNE_IMG_RE})
         
         for img in rune_imgs[:15]:  # Check first 15 rune images
             alt = img.get('alt', '')
@@ -301,32 +337,21 @@ class ChampionStatsScraper:
             
             class_str = ' '.join(img_class) if isinstance(img_class, list) else str(img_class)
             
-            if alt in keystones and 'grayscale' not in class_str:
+            if alt in RUNE_TO_TREE and 'grayscale' not in class_str:
                 primary = alt
                 break
         
-        rune_to_tree = {
-            "Lethal Tempo": "Precision", "Fleet Footwork": "Precision", 
-            "Press the Attack": "Precision", "Conqueror": "Precision",
-            "Electrocute": "Domination", "Dark Harvest": "Domination", "Hail of Blades": "Domination",
-            "Arcane Comet": "Sorcery", "Phase Rush": "Sorcery", "Summon Aery": "Sorcery",
-            "Grasp of the Undying": "Resolve", "Aftershock": "Resolve", "Guardian": "Resolve",
-            "First Strike": "Inspiration", "Glacial Augment": "Inspiration", "Unsealed Spellbook": "Inspiration"
-        }
-        
-        primary_tree = rune_to_tree.get(primary, "Unknown")
+        primary_tree = RUNE_TO_TREE.get(primary, "Unknown")
         
         secondary_rune_found = False
         for i, img in enumerate(rune_imgs[5:25]):  # Skip first few, check next 20
             src = img.get('src', '')
             
-            rune_id_match = re.search(r'/rune\d+/(\d{4})', src)
+            rune_id_match = RUNE_ID_RE.search(src)
             if rune_id_match:
                 rune_id = int(rune_id_match.group(1))
                 tree_id = rune_id // 100
-                
-                tree_map = {80: "Precision", 81: "Domination", 82: "Sorcery", 83: "Inspiration", 84: "Resolve"}
-                detected_tree = tree_map.get(tree_id)
+                detected_tree = RUNE_TREE_IDS.get(tree_id)
                 
                 if detected_tree and detected_tree != primary_tree:
                     secondary = detected_tree
@@ -334,7 +359,7 @@ class ChampionStatsScraper:
                     break
         
         if primary != "Unknown":
-            print(f"      🎯 Runes: {primary} / {secondary}")
+            logger.debug("      🎯 Runes: %s / %s", primary, secondary)
         
         return primary, secondary
     
@@ -346,21 +371,25 @@ class ChampionStatsScraper:
         if not stats1 or not stats2:
             return None
         
+        return self.compare_stats(stats1, stats2)
+    
+    def compare_stats(self, stats1: DetailedChampionStats, stats2: DetailedChampionStats) -> Dict:
+        """Build a matchup comparison from two already-fetched champions"""
         matchup_wr = None
-        champ2_lower = champ2.lower()
+        champ2_lower = stats2.champion_name.lower()
         
         for matchup in stats1.best_matchups + stats1.worst_matchups:
             if champ2_lower in matchup.opponent_name.lower():
                 matchup_wr = matchup.win_rate
-                print(f"   🎯 Found matchup: {stats1.champion_name} vs {matchup.opponent_name} = {matchup_wr:.1f}%")
+                logger.debug("   🎯 Found matchup: %s vs %s = %.1f%%", stats1.champion_name, matchup.opponent_name, matchup_wr)
                 break
         
         if matchup_wr is None:
-            champ1_lower = champ1.lower()
+            champ1_lower = stats1.champion_name.lower()
             for matchup in stats2.best_matchups + stats2.worst_matchups:
                 if champ1_lower in matchup.opponent_name.lower():
                     matchup_wr = 100 - matchup.win_rate
-                    print(f"   🎯 Found reverse matchup: {matchup.opponent_name} vs {stats2.champion_name} = {100-matchup_wr:.1f}% (flipped to {matchup_wr:.1f}%)")
+                    logger.debug("   🎯 Found reverse matchup: %s vs %s = %.1f%% (flipped to %.1f%%)", matchup.opponent_name, stats2.champion_name, 100 - matchup_wr, matchup_wr)
                     break
         
         final_matchup_wr = matchup_wr if matchup_wr is not None else 50.0
@@ -374,11 +403,4 @@ class ChampionStatsScraper:
     
     def _calculate_difficulty(self, win_rate: float) -> str:
         """Calculate matchup difficulty"""
-        if win_rate >= 55:
-            return "Easy"
-        elif win_rate >= 50:
-            return "Skill Matchup"
-        elif win_rate >= 45:
-            return "Difficult"
-        else:
-            return "Very Hard"
+        return DIFFICULTY_LABELS[bisect_right(DIFFICULTY_WR_THRESHOLDS, win_rate)]
@@ -0,0 +1,21 @@
+"""
+HTTP session setup
+One pooled, retrying requests.Session that all scrapers can share
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def create_session(pool_size: int = 20, retries: int = 3) -> requests.Session:
+    """Session with keep-alive pooling and backoff retries on transient server errors
+
+    429s are not retried here, the scrapers handle rate limits themselves
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET"]), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
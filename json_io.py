@@ -0,0 +1,101 @@
+"""
+JSON file helpers
+Uses orjson when it's installed (much faster encode/decode), stdlib json otherwise
+Paths ending in .gz are gzip-compressed transparently
+"""
+
+import gzip
+import io
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from typing import Any, Iterable, Sequence
+
+try:
+    import orjson
+    _ORJSON_OPTION = orjson.OPT_NON_STR_KEYS
+except ImportError:  # Optional speedup, stdlib json works fine
+    orjson = None
+    _ORJSON_OPTION = 0
+
+def _default(obj):
+    """stdlib fallback for objects json can't encode (orjson handles dataclasses natively)"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+GZIP_LEVEL = 6  # Good size/speed balance, level 9 is much slower for little gain
+
+def _is_gzip(path) -> bool:
+    return str(path).endswith('.gz')
+
+def _open(path, mode: str, buffering: int = -1):
+    """open() for binary ('rb'/'wb') or UTF-8 text ('r'/'w') modes, gzip for .gz paths"""
+    binary = 'b' in mode
+    if _is_gzip(path):
+        if 'w' in mode and buffering > 1:
+            # GzipFile compresses on every write() call, batch the small row writes first
+            f = io.BufferedWriter(gzip.GzipFile(path, 'wb', compresslevel=GZIP_LEVEL), buffer_size=buffering)
+            return f if binary else io.TextIOWrapper(f, encoding='utf-8')
+        if binary:
+            return gzip.open(path, mode, compresslevel=GZIP_LEVEL)
+        return gzip.open(path, mode + 't', compresslevel=GZIP_LEVEL, encoding='utf-8')
+    if binary:
+        return open(path, mode, buffering=buffering)
+    return open(path, mode, buffering=buffering, encoding='utf-8')
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON from bytes or str (e.g. a response body)"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_json(path: str) -> Any:
+    """Read and parse a JSON file"""
+    if orjson:
+        with _open(path, 'rb') as f:
+            return loads_json(f.read())
+    with _open(path, 'r') as f:
+        return json.load(f)
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (indented by 2 spaces unless indent=False)"""
+    if orjson:
+        option = _ORJSON_OPTION
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def write_bytes_atomic(payload: bytes, path: str):
+    """Write bytes to path via a temp file, so a crash mid-write never leaves a truncated file"""
+    if _is_gzip(path):
+        payload = gzip.compress(payload, compresslevel=GZIP_LEVEL)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def dump_json_table(fields: Sequence[str], rows: Iterable[Sequence[Any]], path: str):
+    """Write rows in a columnar layout {"fields": [...], "rows": [[...], ...]}, one row per line
+
+    Field names are written once instead of being repeated as keys in every record
+    """
+    if orjson:
+        with _open(path, 'wb', buffering=1 << 16) as f:
+            f.write(b'{"fields":' + orjson.dumps(list(fields)) + b',"rows":[')
+            f.writelines(
+                (b',\n  ' if i else b'\n  ') + orjson.dumps(row, option=_ORJSON_OPTION)
+                for i, row in enumerate(rows)
+            )
+            f.write(b'\n]}\n')
+        return
+    with _open(path, 'w', buffering=1 << 16) as f:
+        f.write('{"fields":' + json.dumps(list(fields), separators=(',', ':')) + ',"rows":[')
+        f.writelines(
+            (',\n  ' if i else '\n  ') + json.dumps(row, separators=(',', ':'), default=_default)
+            for i, row in enumerate(rows)
+        )
+        f.write('\n]}\n')
@@ -3,11 +3,18 @@ Storage system for manually added matches
 Allows tracking custom games, tournament games, or specific matches
 """
 
-import json
+import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+
+from json_io import load_json, dump_json_table
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class ManualMatch:
@@ -25,6 +32,25 @@ class ManualMatch:
     date: str
     notes: str = ""
     
+    @classmethod
+    def from_participant(cls, participant: Dict, match_id: str, summoner_name: str, champion_name: str,
+                         game_duration_seconds: int, queue_type: str, date: str, notes: str = "") -> "ManualMatch":
+        """Build a match from a Riot match-v5 participant entry (the shared template for every auto-import)"""
+        return cls(
+            match_id=match_id,
+            summoner_name=summoner_name,
+            champion_name=champion_name,
+            result="WIN" if participant['win'] else "LOSS",
+            kills=float(participant['kills']),
+            deaths=float(participant['deaths']),
+            assists=float(participant['assists']),
+            cs=float(participant['totalMinionsKilled'] + participant['neutralMinionsKilled']),
+            game_duration=int(game_duration_seconds / 60),
+            queue_type=queue_type,
+            date=date,
+            notes=notes
+        )
+    
     @property
     def kda(self):
         """Calculate KDA"""
@@ -39,50 +65,121 @@ class ManualMatch:
             return 0
         return self.cs / self.game_duration
 
+# Column order used in manual_matches.json
+MATCH_FIELDS = tuple(f.name for f in fields(ManualMatch))
+_match_row = attrgetter(*MATCH_FIELDS)
+
 class ManualMatchStorage:
     """Manages storage and retrieval of manual matches"""
     
     def __init__(self, storage_file: str = "manual_matches.json"):
         self.storage_file = storage_file
-        self.matches: List[ManualMatch] = []
-        self.load_matches()
+        # Read from disk on first access (or via preload), not while the owner is starting up
+        self._matches: Optional[List[ManualMatch]] = None
+        # Re-entrant: load_matches runs under it and assigns through the (also locked) matches setter
+        self._load_lock = threading.RLock()
+        # Lookup indices, rebuilt whenever the match list is replaced and kept up to date by add_match
+        self._match_ids = set()
+        self._by_summoner: Dict[str, List[ManualMatch]] = {}
+        self.version = 0  # Bumped on every change, lets callers reuse results built from an unchanged store
+        # While a batch() is open saves only mark the file dirty, it's written once when the batch closes
+        self._batch_depth = 0
+        self._dirty = False
+    
+    @property
+    def matches(self) -> List[ManualMatch]:
+        """All stored matches, loaded from the storage file on first access"""
+        if self._matches is None:
+            with self._load_lock:
+                if self._matches is None:
+                    self.load_matches()
+        return self._matches
+    
+    @matches.setter
+    def matches(self, value: List[ManualMatch]):
+        # Build the indices first and publish the list last, so the unlocked fast paths
+        # (which only check _matches) never see a loaded list with a half-built index
+        match_ids = {m.match_id for m in value}
+        by_summoner: Dict[str, List[ManualMatch]] = {}
+        for m in value:
+            by_summoner.setdefault(m.summoner_name.lower(), []).append(m)
+        with self._load_lock:
+            self.version += 1
+            self._match_ids = match_ids
+            self._by_summoner = by_summoner
+            self._matches = value
+    
+    def preload(self):
+        """Load the storage file now if it hasn't been read yet (e.g. from a background thread), returns the match count"""
+        return len(self.matches)
     
     def load_matches(self):
         """Load matches from JSON file"""
         if os.path.exists(self.storage_file):
             try:
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_json(self.storage_file)
+                if isinstance(data, dict):
+                    # Columnar layout {"fields": [...], "rows": [...]}
+                    columns = tuple(data['fields'])
+                    if columns == MATCH_FIELDS:
+                        self.matches = [ManualMatch(*row) for row in data['rows']]
+                    else:
+                        self.matches = [ManualMatch(**dict(zip(columns, row))) for row in data['rows']]
+                else:
+                    # Older files store one object per match
                     self.matches = [ManualMatch(**match) for match in data]
-                print(f"✅ Loaded {len(self.matches)} manual matches from {self.storage_file}")
+                logger.info("✅ Loaded %d manual matches from %s", len(self.matches), self.storage_file)
             except Exception as e:
-                print(f"⚠️ Error loading manual matches: {e}")
+                logger.warning("⚠️ Error loading manual matches: %s", e)
                 self.matches = []
         else:
             self.matches = []
     
+    @contextmanager
+    def batch(self):
+        """Group many add/remove calls into a single save (batches may nest)"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self.save_matches()
+    
     def save_matches(self):
-        """Save matches to JSON file"""
+        """Save matches to JSON file (deferred until the outermost batch() closes)"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._dirty = False
         try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                data = [asdict(match) for match in self.matches]
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"✅ Saved {len(self.matches)} manual matches to {self.storage_file}")
+            # One row per match, field names are only written once
+            dump_json_table(MATCH_FIELDS, map(_match_row, self.matches), self.storage_file)
+            logger.debug("✅ Saved %d manual matches to %s", len(self.matches), self.storage_file)
         except Exception as e:
-            print(f"⚠️ Error saving manual matches: {e}")
+            logger.error("⚠️ Error saving manual matches: %s", e)
     
     def add_match(self, match: ManualMatch):
         """Add a new manual match"""
         # Check if match ID already exists
-        if any(m.match_id == match.match_id for m in self.matches):
-            print(f"⚠️ Match ID {match.match_id} already exists")
+        if self.has_match(match.match_id):
+            logger.warning("⚠️ Match ID %s already exists", match.match_id)
             return False
         
         self.matches.append(match)
+        self.version += 1
+        self._match_ids.add(match.match_id)
+        self._by_summoner.setdefault(match.summoner_name.lower(), []).append(match)
         self.save_matches()
-        print(f"✅ Added manual match: {match.champion_name} ({match.result})")
+        logger.debug("✅ Added manual match: %s (%s)", match.champion_name, match.result)
         return True
     
+    def has_match(self, match_id: str) -> bool:
+        """Check whether a match ID is already stored"""
+        if self._matches is None:
+            self.preload()
+        return match_id in self._match_ids
+    
     def remove_match(self, match_id: str):
         """Remove a match by ID"""
         original_count = len(self.matches)
@@ -90,36 +187,64 @@ class ManualMatchStorage:
         
         if len(self.matches) < original_count:
             self.save_matches()
-            print(f"✅ Removed match {match_id}")
+            logger.info("✅ Removed match %s", match_id)
             return True
         else:
-            print(f"⚠️ Match ID {match_id} not found")
+            logger.warning("⚠️ Match ID %s not found", match_id)
             return False
     
-    def get_matches_for_summoner(self, summoner_name: str) -> List[ManualMatch]:
-        """Get all matches for a specific summoner"""
-        return [m for m in self.matches if m.summoner_name.lower() == summoner_name.lower()]
+    def remove_matches_for_summoner(self, summoner_name: str) -> int:
+        """Remove every match for a summoner in one pass and save once, returns how many were removed"""
+        remaining = [m for m in self.matches if m.summoner_name != summoner_name]
+        removed = len(self.matches) - len(remaining)
+        
+        if removed:
+            self.matches = remaining
+            self.save_matches()
+            logger.info("✅ Removed %d matches for %s", removed, summoner_name)
+        return removed
+    
+    def get_matches_for_summoner(self, summoner_name: str, limit: Optional[int] = None) -> List[ManualMatch]:
+        """Get all matches for a specific summoner (or only the first limit of them)"""
+        if self._matches is None:
+            self.preload()
+        return self._by_summoner.get(summoner_name.lower(), [])[:limit]
+    
+    def count_matches_for_summoner(self, summoner_name: str) -> int:
+        """Number of stored matches for a summoner, without copying them"""
+        if self._matches is None:
+            self.preload()
+        return len(self._by_summoner.get(summoner_name.lower(), ()))
     
     def get_champion_stats(self, summoner_name: str, champion_name: str) -> Dict:
         """Get aggregated stats for a champion"""
-        matches = [m for m in self.matches 
-                  if m.summoner_name.lower() == summoner_name.lower() 
-                  and m.champion_name.lower() == champion_name.lower()]
+        champion_lower = champion_name.lower()
+        matches = [m for m in self.get_matches_for_summoner(summoner_name)
+                  if m.champion_name.lower() == champion_lower]
         
         if not matches:
             return None
         
+        return self._aggregate(champion_name, matches)
+    
+    def _aggregate(self, champion_name: str, matches: List[ManualMatch]) -> Dict:
+        """Totals and averages for a non-empty list of matches on one champion"""
         games = len(matches)
-        wins = sum(1 for m in matches if m.result == "WIN")
+        wins = 0
+        total_kills = total_deaths = total_assists = total_cs = 0.0
+        total_duration = 0
+        # All totals in one pass over the matches
+        for m in matches:
+            if m.result == "WIN":
+                wins += 1
+            total_kills += m.kills
+            total_deaths += m.deaths
+            total_assists += m.assists
+            total_cs += m.cs
+            total_duration += m.game_duration
         losses = games - wins
         win_rate = (wins / games * 100) if games > 0 else 0
         
-        total_kills = sum(m.kills for m in matches)
-        total_deaths = sum(m.deaths for m in matches)
-        total_assists = sum(m.assists for m in matches)
-        total_cs = sum(m.cs for m in matches)
-        total_duration = sum(m.game_duration for m in matches)
-        
         avg_kills = total_kills / games
         avg_deaths = total_deaths / games
         avg_assists = total_assists / games
@@ -141,27 +266,24 @@ class ManualMatchStorage:
     
     def get_all_champion_stats(self, summoner_name: str) -> List[Dict]:
         """Get stats for all champions played"""
-        matches = self.get_matches_for_summoner(summoner_name)
-        
-        # Group by champion
-        champions = set(m.champion_name for m in matches)
+        # Group by champion in one pass (case-insensitive, like get_champion_stats)
+        by_champion: Dict[str, List[ManualMatch]] = {}
+        for m in self.get_matches_for_summoner(summoner_name):
+            by_champion.setdefault(m.champion_name.lower(), []).append(m)
         
-        stats = []
-        for champion in champions:
-            champion_stats = self.get_champion_stats(summoner_name, champion)
-            if champion_stats:
-                stats.append(champion_stats)
+        stats = [self._aggregate(group[0].champion_name, group) for group in by_champion.values()]
         
         # Sort by games played
-        stats.sort(key=lambda x: x['games_played'], reverse=True)
+        stats.sort(key=itemgetter('games_played'), reverse=True)
         
         return stats
     
     def clear_all_matches(self):
         """Clear all matches"""
-        self.matches = []
-        self.save_matches()
-        print("✅ Cleared all manual matches")
+        if self.matches:  # Already empty, nothing to rewrite
+            self.matches = []
+            self.save_matches()
+        logger.info("✅ Cleared all manual matches")
 
 # Example usage
 if __name__ == "__main__":
@@ -4,15 +4,39 @@ Riot Games API Scraper for League of Legends
 Provides comprehensive champion statistics using the official Riot Games API
 """
 
+import logging
 import requests
+from requests.auth import AuthBase
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import json
+from operator import attrgetter
+from urllib.parse import urlparse
+
+from http_session import create_session
+from json_io import loads_json
+from scraper_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Platform region -> regional routing value, built once instead of per request
+ACCOUNT_ROUTING_REGIONS = {
+    'euw': 'europe', 'na': 'americas', 'kr': 'asia',
+    'eune': 'europe', 'br': 'americas', 'jp': 'asia',
+    'ru': 'europe', 'oce': 'sea', 'tr': 'europe',
+    'lan': 'americas', 'las': 'americas'
+}
+MATCH_ROUTING_REGIONS = {**ACCOUNT_ROUTING_REGIONS, 'oce': 'americas'}
 
 @dataclass
 class RiotChampionPerformance:
     """Champion performance data from Riot API"""
+    # No per-instance __dict__, one of these per champion on every account
+    __slots__ = ('champion_name', 'champion_id', 'games_played', 'wins', 'losses', 'win_rate',
+                 'kills', 'deaths', 'assists', 'kda', 'cs_per_min', 'queue_type')
+    
     champion_name: str
     champion_id: int
     games_played: int
@@ -40,11 +64,34 @@ class RiotPlayerAccount:
     flex_lp: int
     champion_performances: List[RiotChampionPerformance]
     last_updated: str
+    
+    def __post_init__(self):
+        # Keep performances ordered by games played so consumers never have to re-sort
+        self.champion_performances.sort(key=attrgetter('games_played'), reverse=True)
+
+class _RiotTokenAuth(AuthBase):
+    """Attach the Riot API key only to *.api.riotgames.com, so a shared session never leaks it"""
+    
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+    
+    def __call__(self, request):
+        host = urlparse(request.url).hostname or ""
+        if host.endswith(".api.riotgames.com"):
+            request.headers['X-Riot-Token'] = self.api_key
+            request.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        return request
 
 class RiotApiScraper:
     """Scraper using Riot Games API for comprehensive League of Legends data"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # In-memory champion mapping shared by every instance, saves re-reading the disk cache every command
+    _champion_mapping: Optional[Dict[int, str]] = None
+    _champion_mapping_loaded_at = 0.0
+    _champion_ids_by_name: Dict[str, int] = {}  # Reverse of the mapping, lowercase name -> ID
+    _champion_mapping_lock = threading.Lock()
+    
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key
         self.base_urls = {
             'euw': 'https://euw1.api.riotgames.com',
@@ -59,65 +106,76 @@ class RiotApiScraper:
             'lan': 'https://la1.api.riotgames.com',
             'las': 'https://la2.api.riotgames.com'
         }
-        self.session = requests.Session()
+        # Pass a session in to share its connection pool with the other scrapers
+        self.session = session or create_session()
         if self.api_key:
-            self.session.headers.update({
-                'X-Riot-Token': self.api_key,
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            self.session.auth = _RiotTokenAuth(self.api_key)
         self.last_request_time = 0
         self.request_delay = 0.05  # 50ms delay between requests (20 req/sec max)
+        self._rate_lock = threading.Lock()
+        # Data Dragon champion list only changes on patch day, keep a copy on disk between runs
+        self._ddragon_cache = DiskCache("ddragon", ttl=24 * 3600)
+        # Finished matches never change, keep their details across restarts (the TTL only bounds the cache size)
+        self._match_cache = DiskCache("matches", ttl=30 * 24 * 3600)
+    
+    def prune_caches(self) -> int:
+        """Remove expired Data Dragon and match entries from the disk caches, returns how many were removed"""
+        return self._ddragon_cache.prune() + self._match_cache.prune()
+    
+    def _wait_for_request_slot(self):
+        """Sleep until the next request slot is free (safe to call from worker threads)"""
+        with self._rate_lock:
+            now = time.time()
+            next_slot = max(now, self.last_request_time + self.request_delay)
+            self.last_request_time = next_slot
+        if next_slot > now:
+            time.sleep(next_slot - now)
     
     def get_summoner_by_riot_id(self, game_name: str, tag_line: str, region: str = "euw") -> Optional[Dict]:
         """Get summoner information by Riot ID (gameName#tagLine)"""
         if not self.api_key:
-            print("❌ API key required for Riot API access")
+            logger.error("❌ API key required for Riot API access")
             return None
         
         try:
-            # Map region to routing value for account-v1
-            routing_regions = {
-                'euw': 'europe', 'na': 'americas', 'kr': 'asia',
-                'eune': 'europe', 'br': 'americas', 'jp': 'asia',
-                'ru': 'europe', 'oce': 'sea', 'tr': 'europe',
-                'lan': 'americas', 'las': 'americas'
-            }
-            
-            routing_region = routing_regions.get(region, 'europe')
+            routing_region = ACCOUNT_ROUTING_REGIONS.get(region, 'europe')
             
             # Step 1: Get account by Riot ID
             account_url = f"https://{routing_region}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
+            # Lookups can run concurrently (e.g. !syncteam prefetch), so they share the rate limiter too
+            self._wait_for_request_slot()
             account_response = self.session.get(account_url, timeout=10)
             
             if account_response.status_code != 200:
                 if account_response.status_code == 404:
-                    print(f"❌ Riot ID not found: {game_name}#{tag_line}")
+                    logger.error("❌ Riot ID not found: %s#%s", game_name, tag_line)
                 elif account_response.status_code == 403:
-                    print("❌ API key forbidden - check your key permissions")
+                    logger.error("❌ API key forbidden - check your key permissions")
                 else:
-                    print(f"❌ API error: {account_response.status_code}")
+                    logger.error("❌ API error: %s", account_response.status_code)
                 return None
             
-            account_data = account_response.json()
+            account_data = loads_json(account_response.content)
             puuid = account_data['puuid']
             
             # Step 2: Get summoner by PUUID
             summoner_url = f"{self.base_urls[region]}/lol/summoner/v4/summoners/by-puuid/{puuid}"
+            self._wait_for_request_slot()
             summoner_response = self.session.get(summoner_url, timeout=10)
             
             if summoner_response.status_code == 200:
-                summoner_data = summoner_response.json()
+                summoner_data = loads_json(summoner_response.content)
                 summoner_data['riotId'] = f"{game_name}#{tag_line}"
                 summoner_data['name'] = f"{game_name}#{tag_line}"  # Add name field for compatibility
                 summoner_data['gameName'] = game_name
                 summoner_data['tagLine'] = tag_line
                 return summoner_data
             else:
-                print(f"❌ Could not fetch summoner data: {summoner_response.status_code}")
+                logger.error("❌ Could not fetch summoner data: %s", summoner_response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting summoner: {e}")
+            logger.error("❌ Error getting summoner: %s", e)
             return None
     
     def get_summoner_by_name(self, summoner_name: str, region: str = "euw") -> Optional[Dict]:
@@ -128,7 +186,7 @@ class RiotApiScraper:
             return self.get_summoner_by_riot_id(parts[0], parts[1], region)
         else:
             # Try to use it as game name with common tag
-            print(f"⚠️ No tag provided, trying {summoner_name}#EUW")
+            logger.warning("⚠️ No tag provided, trying %s#EUW", summoner_name)
             return self.get_summoner_by_riot_id(summoner_name, region.upper(), region)
     
     def get_summoner_ranked_info(self, puuid: str, region: str = "euw") -> Dict:
@@ -141,7 +199,7 @@ class RiotApiScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                entries = response.json()
+                entries = loads_json(response.content)
                 ranked_info = {"soloq_rank": "Unranked", "flex_rank": "Unranked", "soloq_lp": 0, "flex_lp": 0}
                 
                 for entry in entries:
@@ -157,7 +215,7 @@ class RiotApiScraper:
                 return {"soloq_rank": "Unranked", "flex_rank": "Unranked", "soloq_lp": 0, "flex_lp": 0}
                 
         except Exception as e:
-            print(f"❌ Error getting ranked info: {e}")
+            logger.error("❌ Error getting ranked info: %s", e)
             return {"soloq_rank": "Unranked", "flex_rank": "Unranked", "soloq_lp": 0, "flex_lp": 0}
     
     def get_champion_masteries(self, puuid: str, region: str = "euw") -> List[Dict]:
@@ -170,12 +228,12 @@ class RiotApiScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             else:
                 return []
                 
         except Exception as e:
-            print(f"❌ Error getting champion masteries: {e}")
+            logger.error("❌ Error getting champion masteries: %s", e)
             return []
     
     def get_match_history(self, puuid: str, region: str = "euw", count: int = 100, queue: int = None) -> List[str]:
@@ -191,21 +249,7 @@ class RiotApiScraper:
             return []
         
         try:
-            routing_regions = {
-                'euw': 'europe',
-                'na': 'americas',
-                'kr': 'asia',
-                'eune': 'europe',
-                'br': 'americas',
-                'jp': 'asia',
-                'ru': 'europe',
-                'oce': 'americas',
-                'tr': 'europe',
-                'lan': 'americas',
-                'las': 'americas'
-            }
-            
-            routing_region = routing_regions.get(region, 'europe')
+            routing_region = MATCH_ROUTING_REGIONS.get(region, 'europe')
             url = f"https://{routing_region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
             
             all_matches = []
@@ -223,7 +267,7 @@ class RiotApiScraper:
                 response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
-                    batch = response.json()
+                    batch = loads_json(response.content)
                     if not batch:  # No more games
                         break
                     all_matches.extend(batch)
@@ -236,7 +280,7 @@ class RiotApiScraper:
                 elif response.status_code == 429:
                     # Rate limited
                     retry_after = int(response.headers.get('Retry-After', 2))
-                    print(f"⚠️ Rate limited, waiting {retry_after} seconds...")
+                    logger.warning("⚠️ Rate limited, waiting %s seconds...", retry_after)
                     time.sleep(retry_after)
                     continue  # Retry same batch
                 else:
@@ -245,121 +289,156 @@ class RiotApiScraper:
             return all_matches[:count]  # Return exactly count requested
                 
         except Exception as e:
-            print(f"❌ Error getting match history: {e}")
+            logger.error("❌ Error getting match history: %s", e)
             return []
     
     def get_match_details(self, match_id: str, region: str = "euw") -> Optional[Dict]:
-        """Get detailed match information with rate limiting"""
+        """Get detailed match information (from the disk cache when this match was fetched before)"""
         if not self.api_key:
             return None
         
+        details = self._match_cache.get(match_id)
+        if details is None:
+            details = self._fetch_match_details(match_id, region)
+            if details:
+                self._match_cache.set(match_id, details)
+        return details
+    
+    def _fetch_match_details(self, match_id: str, region: str) -> Optional[Dict]:
+        """Request match details from match-v5 with rate limiting"""
         try:
             # Rate limiting: ensure minimum delay between requests
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.request_delay:
-                time.sleep(self.request_delay - time_since_last)
+            self._wait_for_request_slot()
             
-            routing_regions = {
-                'euw': 'europe',
-                'na': 'americas',
-                'kr': 'asia',
-                'eune': 'europe',
-                'br': 'americas',
-                'jp': 'asia',
-                'ru': 'europe',
-                'oce': 'americas',
-                'tr': 'europe',
-                'lan': 'americas',
-                'las': 'americas'
-            }
-            
-            routing_region = routing_regions.get(region, 'europe')
+            routing_region = MATCH_ROUTING_REGIONS.get(region, 'europe')
             url = f"https://{routing_region}.api.riotgames.com/lol/match/v5/matches/{match_id}"
             
             response = self.session.get(url, timeout=10)
-            self.last_request_time = time.time()
             
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             elif response.status_code == 429:
                 # Rate limited, wait and retry once
                 retry_after = min(int(response.headers.get('Retry-After', 1)), 3)  # Max 3 seconds
-                print(f"⚠️ Rate limited, waiting {retry_after} seconds...")
+                logger.warning("⚠️ Rate limited, waiting %s seconds...", retry_after)
                 time.sleep(retry_after)
+                self._wait_for_request_slot()
                 response = self.session.get(url, timeout=10)
-                self.last_request_time = time.time()
                 if response.status_code == 200:
-                    return response.json()
+                    return loads_json(response.content)
                 else:
-                    print(f"❌ Still rate limited after retry")
+                    logger.error("❌ Still rate limited after retry")
                     return None
             else:
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting match details: {e}")
+            logger.error("❌ Error getting match details: %s", e)
             return None
     
+    def get_multiple_match_details(self, match_ids: List[str], region: str = "euw", max_workers: int = 4) -> Dict[str, Dict]:
+        """Fetch several matches concurrently, returns {match_id: details} for the ones that succeeded"""
+        results = {}
+        if not match_ids:
+            return results
+        
+        # Requests still go through the shared rate limiter, so the pool only overlaps network latency
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(match_ids))) as executor:
+            futures = {executor.submit(self.get_match_details, match_id, region): match_id for match_id in match_ids}
+            for future in as_completed(futures):
+                details = future.result()
+                if details:
+                    results[futures[future]] = details
+        
+        return results
+    
     def get_champion_data(self) -> Dict[int, str]:
-        """Get champion ID to name mapping from Data Dragon"""
+        """Get champion ID to name mapping from Data Dragon (cached in memory and on disk for a day)"""
+        champion_mapping = self._fresh_champion_mapping()
+        if champion_mapping:
+            return champion_mapping
+        
+        # Only one thread (across all instances) reads the disk cache / fetches, the rest reuse its result
+        with RiotApiScraper._champion_mapping_lock:
+            champion_mapping = self._fresh_champion_mapping() or self._ddragon_cache.get("champion_mapping")
+            if champion_mapping:
+                self._remember_champion_mapping(champion_mapping)
+                return champion_mapping
+            return self._fetch_champion_data()
+    
+    def _fresh_champion_mapping(self) -> Optional[Dict[int, str]]:
+        """The shared in-memory mapping if it's younger than the disk cache TTL"""
+        mapping = RiotApiScraper._champion_mapping
+        if mapping and time.time() - RiotApiScraper._champion_mapping_loaded_at < self._ddragon_cache.ttl:
+            return mapping
+        return None
+    
+    def _fetch_champion_data(self) -> Dict[int, str]:
+        """Download the champion list from Data Dragon and cache it"""
         try:
             versions_url = "https://ddragon.leagueoflegends.com/api/versions.json"
-            versions_response = requests.get(versions_url, timeout=10)
+            versions_response = self.session.get(versions_url, timeout=10)
             
             if versions_response.status_code != 200:
                 return {}
             
-            latest_version = versions_response.json()[0]
+            latest_version = loads_json(versions_response.content)[0]
             
             champions_url = f"https://ddragon.leagueoflegends.com/cdn/{latest_version}/data/en_US/champion.json"
-            champions_response = requests.get(champions_url, timeout=10)
+            champions_response = self.session.get(champions_url, timeout=10)
             
             if champions_response.status_code != 200:
                 return {}
             
-            champions_data = champions_response.json()
+            champions_data = loads_json(champions_response.content)
             champion_mapping = {}
             
             for champion_id, champion_info in champions_data['data'].items():
                 champion_mapping[int(champion_info['key'])] = champion_info['name']
             
+            if champion_mapping:
+                self._ddragon_cache.set("champion_mapping", champion_mapping)
+                self._remember_champion_mapping(champion_mapping)
             return champion_mapping
             
         except Exception as e:
-            print(f"❌ Error getting champion data: {e}")
+            logger.error("❌ Error getting champion data: %s", e)
             return {}
     
+    def _remember_champion_mapping(self, champion_mapping: Dict[int, str]):
+        """Keep the mapping in memory for the next get_champion_data call on any instance"""
+        RiotApiScraper._champion_ids_by_name = {name.lower(): champion_id for champion_id, name in champion_mapping.items()}
+        RiotApiScraper._champion_mapping = champion_mapping
+        RiotApiScraper._champion_mapping_loaded_at = time.time()
+    
+    def get_champion_id(self, champion_name: str) -> Optional[int]:
+        """Champion ID for a name (case-insensitive), looked up in the reverse index built with the mapping"""
+        self.get_champion_data()
+        return RiotApiScraper._champion_ids_by_name.get(champion_name.lower())
+    
     def get_tournament_matches(self, tournament_code: str, region: str = "euw") -> List[str]:
         """Get match IDs from a tournament code"""
         if not self.api_key:
-            print("❌ API key required for tournament code access")
+            logger.error("❌ API key required for tournament code access")
             return []
         
         try:
-            routing_regions = {
-                'euw': 'europe', 'na': 'americas', 'kr': 'asia',
-                'eune': 'europe', 'br': 'americas', 'jp': 'asia',
-                'ru': 'europe', 'oce': 'americas', 'tr': 'europe',
-                'lan': 'americas', 'las': 'americas'
-            }
-            
-            routing_region = routing_regions.get(region, 'europe')
+            routing_region = MATCH_ROUTING_REGIONS.get(region, 'europe')
             url = f"https://{routing_region}.api.riotgames.com/lol/match/v5/matches/by-tournament-code/{tournament_code}/ids"
             
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             elif response.status_code == 404:
-                print(f"❌ No matches found for tournament code: {tournament_code}")
+                logger.error("❌ No matches found for tournament code: %s", tournament_code)
                 return []
             else:
-                print(f"❌ API error: {response.status_code}")
+                logger.error("❌ API error: %s", response.status_code)
                 return []
                 
         except Exception as e:
-            print(f"❌ Error getting tournament matches: {e}")
+            logger.error("❌ Error getting tournament matches: %s", e)
             return []
     
     def get_current_game(self, summoner_id: str, region: str = "euw") -> Optional[Dict]:
@@ -372,15 +451,15 @@ class RiotApiScraper:
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             elif response.status_code == 404:
                 return None  # Not in game
             else:
-                print(f"❌ API error: {response.status_code}")
+                logger.error("❌ API error: %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting current game: {e}")
+            logger.error("❌ Error getting current game: %s", e)
             return None
     
     def get_match_timeline(self, match_id: str, region: str = "euw") -> Optional[Dict]:
@@ -389,56 +468,53 @@ class RiotApiScraper:
             return None
         
         try:
-            routing_regions = {
-                'euw': 'europe', 'na': 'americas', 'kr': 'asia',
-                'eune': 'europe', 'br': 'americas', 'jp': 'asia',
-                'ru': 'europe', 'oce': 'americas', 'tr': 'europe',
-                'lan': 'americas', 'las': 'americas'
-            }
-            
-            routing_region = routing_regions.get(region, 'europe')
+            routing_region = MATCH_ROUTING_REGIONS.get(region, 'europe')
             url = f"https://{routing_region}.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline"
             
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                return loads_json(response.content)
             else:
                 return None
                 
         except Exception as e:
-            print(f"❌ Error getting match timeline: {e}")
+            logger.error("❌ Error getting match timeline: %s", e)
             return None
     
     def scrape_player_account(self, summoner_name: str, region: str = "euw") -> Optional[RiotPlayerAccount]:
         """Scrape comprehensive player account data using Riot API"""
         
         if not self.api_key:
-            print("❌ Riot API key required. Please get one from https://developer.riotgames.com/")
-            print("💡 You can still use the OP.GG scraper as a fallback")
+            logger.error("❌ Riot API key required. Please get one from https://developer.riotgames.com/")
+            logger.info("💡 You can still use the OP.GG scraper as a fallback")
             return None
         
         summoner_info = self.get_summoner_by_name(summoner_name, region)
         if not summoner_info:
             return None
         
-        print(f"✅ Found summoner: {summoner_info['name']} (Level {summoner_info['summonerLevel']})")
+        logger.info("✅ Found summoner: %s (Level %s)", summoner_info['name'], summoner_info['summonerLevel'])
         
         ranked_info = self.get_summoner_ranked_info(summoner_info['puuid'], region)
         
         masteries = self.get_champion_masteries(summoner_info['puuid'], region)
-        print(f"📊 Found {len(masteries)} champion masteries")
+        logger.info("📊 Found %d champion masteries", len(masteries))
         
         champion_mapping = self.get_champion_data()
         
         match_ids = self.get_match_history(summoner_info['puuid'], region, count=50, queue=420)
-        print(f"🎮 Found {len(match_ids)} recent matches")
+        logger.info("🎮 Found %d recent matches", len(match_ids))
         
         champion_stats = {}
         
-        for i, match_id in enumerate(match_ids[:20]):  # Process first 20 matches
+        # Fetch the first 20 matches concurrently, the shared rate limiter still paces the requests
+        recent_ids = match_ids[:20]
+        all_details = self.get_multiple_match_details(recent_ids, region)
+        
+        for match_id in recent_ids:
             try:
-                match_details = self.get_match_details(match_id, region)
+                match_details = all_details.get(match_id)
                 if not match_details:
                     continue
                 
@@ -470,8 +546,6 @@ class RiotApiScraper:
                 champion_stats[champion_name]['cs'] += participant['totalMinionsKilled'] + participant['neutralMinionsKilled']
                 champion_stats[champion_name]['duration'] += match_details['info']['gameDuration']
                 
-                time.sleep(0.1)
-                
             except Exception as e:
                 continue
         
@@ -498,8 +572,6 @@ class RiotApiScraper:
                 )
                 champion_performances.append(performance)
         
-        champion_performances.sort(key=lambda x: x.games_played, reverse=True)
-        
         return RiotPlayerAccount(
             summoner_name=summoner_info['name'],
             summoner_id=summoner_info['puuid'],  # Use PUUID as summoner_id (new API)
@@ -516,6 +588,7 @@ class RiotApiScraper:
 
 def main():
     """Test the Riot API scraper"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("🧪 Testing Riot API Scraper...")
     
     api_key = None  # Replace with your actual API key
@@ -9,19 +9,149 @@ Comprehensive Discord bot for League of Legends stats tracking
 
 import discord
 from discord.ext import commands
-import json
 import os
 import asyncio
+import copy
+import logging
+import threading
+import functools
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from dotenv import load_dotenv
 
 from riot_api_scraper import RiotApiScraper
 from manual_matches_storage import ManualMatchStorage, ManualMatch
-from champion_stats_scraper import ChampionStatsScraper
+from champion_stats_scraper import ChampionStatsScraper, champion_icon_url
+from scraper_cache import TTLCache, DiskCache
+from http_session import create_session
+from json_io import load_json, dumps_json, write_bytes_atomic
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Embed colors, every embed picks from this palette
+COLOR_GREEN = 0x00ff00
+COLOR_BLUE = 0x3498db
+COLOR_LIGHT_BLUE = 0x0099ff
+COLOR_GOLD = 0xffd700
+COLOR_ORANGE = 0xff6b35
+COLOR_RED = 0xe74c3c
+COLOR_LOSS_RED = 0xff0000
+COLOR_PURPLE = 0x9b59b6
+COLOR_GREY = 0x95a5a6
+
+# Embed color per tier letter
+TIER_COLORS = {
+    "S": COLOR_GOLD,
+    "A": COLOR_GREEN,
+    "B": COLOR_BLUE,
+    "C": COLOR_ORANGE,
+    "D": COLOR_RED
+}
+
+TIER_EMOJI = {"S": "🏆", "A": "⭐", "B": "👍", "C": "👌", "D": "👎"}
+
+# Row indicators, indexed by how many thresholds a value clears
+WR_EMOJI = ("🔴", "🟢")  # win rate >= 50
+KDA_EMOJI = ("", "✨", "⭐")  # KDA >= 2.0, >= 3.0
+
+# Matchup win rate thresholds and the embed color for each band (bisect_right index)
+MATCHUP_WR_THRESHOLDS = (45, 50, 55)
+MATCHUP_COLORS = (COLOR_RED, COLOR_ORANGE, COLOR_BLUE, COLOR_GREEN)
+
+# Queue names shown for live games
+LIVE_QUEUE_NAMES = {
+    420: "Ranked Solo/Duo",
+    440: "Ranked Flex",
+    450: "ARAM",
+    400: "Normal Draft",
+    430: "Normal Blind"
+}
+
+# Queue ID reference used by !scanqueues
+QUEUE_NAMES = {
+    0: "Custom",
+    420: "Ranked Solo/Duo",
+    440: "Ranked Flex",
+    450: "ARAM",
+    400: "Normal Draft",
+    430: "Normal Blind",
+    700: "Clash",
+    1700: "Tournament Draft / Arena",
+    2000: "Tutorial 1",
+    2010: "Tutorial 2",
+    2020: "Tutorial 3",
+    3100: "Cherry (Arena 2v2v2v2)"
+}
+
+# Queues that !scanqueues reports as custom games
+CUSTOM_QUEUE_IDS = (0, 700, 1700, 2000, 2010, 2020, 3100)
+
+# ManualMatch.queue_type groups: "ranked" stats vs custom/tournament stats
+RANKED_QUEUE_TYPES = frozenset({"ranked", "other"})
+CUSTOM_QUEUE_TYPES = frozenset({"custom", "tournament", "tournament_draft", "scrim", "clash", "arena"})
+# !debug and !viewteam have always counted narrower custom groups, kept as-is
+DEBUG_CUSTOM_QUEUE_TYPES = frozenset({"custom", "tournament", "tournament_draft", "scrim"})
+ROSTER_CUSTOM_QUEUE_TYPES = frozenset({"custom", "tournament", "tournament_draft", "clash"})
+
+# Queue ID -> game type for custom-game imports; queues missing here are skipped
+# (0 = custom lobby, 2000-2020 = tournament codes; Clash, Arena, ARURF etc. are left out)
+CUSTOM_IMPORT_GAME_TYPES = {0: "custom", **{queue_id: "tournament" for queue_id in range(2000, 2021)}}
+
+# Matches fetched per page during imports, each page is stored with a single save
+MATCH_PAGE_SIZE = 20
+
+class ProgressMessage:
+    """A status message edited in place, with edits coalesced to at most one per min_interval seconds"""
+    
+    def __init__(self, ctx, min_interval: float = 1.5):
+        self.ctx = ctx
+        self.min_interval = min_interval
+        self.message = None
+        self._pending = None
+        self._shown = None
+        self._last_edit = None
+    
+    async def update(self, content: str, force: bool = False):
+        """Show content now, or keep it as pending if the last edit was too recent"""
+        self._pending = content
+        now = asyncio.get_running_loop().time()
+        if force or self._last_edit is None or now - self._last_edit >= self.min_interval:
+            await self.flush()
+    
+    async def flush(self):
+        """Push the latest pending content if it isn't already shown"""
+        content = self._pending
+        if content is None or content == self._shown:
+            return
+        self._last_edit = asyncio.get_running_loop().time()
+        if self.message:
+            try:
+                await self.message.edit(content=content)
+                self._shown = content
+                return
+            except Exception:
+                self.message = None  # Connection reset, send a new message instead
+        try:
+            self.message = await self.ctx.send(content)
+            self._shown = content
+        except Exception:
+            pass  # Discord is having issues, continue anyway
+    
+    async def delete(self):
+        """Remove the status message (pending content is dropped)"""
+        if self.message:
+            try:
+                await self.message.delete()
+            except Exception:
+                pass
+            self.message = None
+
 class ScoutLEBot:
     """Discord bot for ScoutLE - League of Legends stats tracking"""
     
@@ -34,37 +164,68 @@ class ScoutLEBot:
         self.bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
         
         # Initialize scrapers and storage
-        self.riot_scraper = RiotApiScraper(self.riot_api_key)
-        self.manual_storage = ManualMatchStorage()
-        self.champion_scraper = ChampionStatsScraper()
+        # One pooled HTTP session shared by both scrapers (keep-alive across commands)
+        self.http = create_session()
+        
+        self.riot_scraper = RiotApiScraper(self.riot_api_key, session=self.http)
+        self.manual_storage = ManualMatchStorage(os.getenv('SCOUTLE_MATCHES_FILE', "manual_matches.json"))
+        
+        # In-memory scrape caches (bounded, safe to use from the worker threads)
+        self._account_cache = TTLCache(maxsize=256, ttl=600)
+        self._champ_cache = TTLCache(maxsize=256, ttl=600)
+        # Rendered !stats sections, keyed on the inputs so unchanged players aren't re-aggregated
+        self._stats_sections_cache = TTLCache(maxsize=128, ttl=600)
+        
+        # On-disk copies survive restarts (champion meta only changes with the patch)
+        self._account_disk_cache = DiskCache("accounts", ttl=15 * 60)
+        self._champ_disk_cache = DiskCache("champions", ttl=6 * 3600)
+        
+        # Shared worker pool so blocking scrapes don't stall the event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, int(os.getenv('SCOUTLE_WORKERS', '8'))), thread_name_prefix="scoutle"
+        )
+        # Single writer thread, so saves land on disk in the order they were made
+        self.io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scoutle-io")
+        # Latest team data payload waiting for the IO thread (None when nothing is queued)
+        self._pending_team_payload = None
+        self._last_team_payload = None  # Newest snapshot handed to the IO thread, unchanged saves are skipped
+        self._team_save_lock = threading.Lock()
+        
+        # Built lazily the first time someone runs !help
+        self._help_embed = None
         
-        self.team_data_file = "team_data.json"
+        # A path ending in .gz is stored gzip-compressed
+        self.team_data_file = os.getenv('SCOUTLE_TEAM_DATA_FILE', "team_data.json")
         self.load_team_data()
         
         self.setup_events()
         self.setup_commands()
     
+    @functools.cached_property
+    def champion_scraper(self) -> ChampionStatsScraper:
+        """Lolalytics scraper, built on first use (fake_useragent loads its browser data when constructed)"""
+        return ChampionStatsScraper(session=self.http)
+    
     def load_team_data(self):
         """Load team data from file (multi-server support)"""
         if os.path.exists(self.team_data_file):
-            with open(self.team_data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Migration: Convert old single-server format to multi-server
-                if "players" in data and "servers" not in data:
-                    print("🔄 Migrating to multi-server format...")
-                    self.team_data = {
-                        "servers": {
-                            "default": {  # Old data goes to "default" server
-                                "players": data.get("players", {}),
-                                "teams": data.get("teams", {}),
-                                "settings": data.get("settings", {})
-                            }
+            data = load_json(self.team_data_file)
+            # Migration: Convert old single-server format to multi-server
+            if "players" in data and "servers" not in data:
+                logger.info("🔄 Migrating to multi-server format...")
+                self.team_data = {
+                    "servers": {
+                        "default": {  # Old data goes to "default" server
+                            "players": data.get("players", {}),
+                            "teams": data.get("teams", {}),
+                            "settings": data.get("settings", {})
                         }
                     }
-                    self.save_team_data()
-                    print("✅ Migration complete! Old data available as 'default' server")
-                else:
-                    self.team_data = data
+                }
+                self.save_team_data()
+                logger.info("✅ Migration complete! Old data available as 'default' server")
+            else:
+                self.team_data = data
         else:
             self.team_data = {
                 "servers": {}  # Server-specific data
@@ -72,9 +233,34 @@ class ScoutLEBot:
             self.save_team_data()
     
     def save_team_data(self):
-        """Save team data to file"""
-        with open(self.team_data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.team_data, f, indent=2, ensure_ascii=False)
+        """Save team data to file (serialized now, written on the IO thread)
+
+        Saves made while a write is still queued are coalesced, only the newest snapshot gets written
+        """
+        # Serialize on the calling thread so later edits can't race the write
+        # Compact output: this runs on every change, and without orjson an indented dump is pure-Python slow
+        payload = dumps_json(self.team_data, indent=False)
+        with self._team_save_lock:
+            if payload == self._last_team_payload:
+                return  # Nothing changed since the last save
+            self._last_team_payload = payload
+            already_queued = self._pending_team_payload is not None
+            self._pending_team_payload = payload
+        if not already_queued:
+            self.io_executor.submit(self._write_team_data)
+    
+    def _write_team_data(self):
+        """Write the newest serialized team data to disk (runs on the IO thread)"""
+        with self._team_save_lock:
+            payload, self._pending_team_payload = self._pending_team_payload, None
+        if payload is None:
+            return
+        try:
+            write_bytes_atomic(payload, self.team_data_file)
+        except OSError as e:
+            logger.error("⚠️ Error saving team data: %s", e)
+            with self._team_save_lock:
+                self._last_team_payload = None  # Let the next save retry even if the data is the same
     
     def get_server_data(self, guild_id: int):
         """Get or create server-specific data"""
@@ -100,61 +286,70 @@ class ScoutLEBot:
         
         return self.team_data["servers"][guild_key]
     
-    def setup_events(self):
-        """Setup Discord event handlers"""
+    def _cached_scrape(self, cache: TTLCache, key, scrape, force_refresh: bool = False, disk_cache: DiskCache = None):
+        """Return a fresh cached result for key, otherwise scrape and store it"""
+        if not force_refresh:
+            data = cache.get(key)
+            if data:
+                return data
+            
+            if disk_cache:
+                data = disk_cache.get(key)
+                if data:
+                    cache.set(key, data)
+                    return data
         
-        @self.bot.event
-        async def on_ready():
-            print(f'🤖 ScoutLE Bot is ready! Logged in as {self.bot.user}')
-            print(f'📊 Connected to {len(self.bot.guilds)} server(s)')
-            
-            activity = discord.Activity(
-                type=discord.ActivityType.watching, 
-                name="League stats | !help"
-            )
-            await self.bot.change_presence(activity=activity)
-        
-        @self.bot.event
-        async def on_command_error(ctx, error):
-            if isinstance(error, commands.CommandNotFound):
-                await ctx.send("❌ Unknown command. Use `!help` to see available commands.")
-            elif isinstance(error, commands.MissingRequiredArgument):
-                await ctx.send(f"❌ Missing argument: {error.param}. Use `!help <command>` for more info.")
-            else:
-                await ctx.send(f"❌ Error: {str(error)}")
-                print(f"Error: {error}")
+        data = scrape()
+        if data:  # Don't cache failed scrapes
+            cache.set(key, data)
+            if disk_cache:
+                disk_cache.set(key, data)
+        return data
     
-    def setup_commands(self):
-        """Setup Discord commands"""
+    def get_player_account(self, riot_id: str, region: str, force_refresh: bool = False):
+        """Get a player's ranked account data (cached per Riot ID and region)"""
+        return self._cached_scrape(
+            self._account_cache, (riot_id.lower(), region),
+            lambda: self.riot_scraper.scrape_player_account(riot_id, region),
+            force_refresh, self._account_disk_cache
+        )
+    
+    def get_champion_stats(self, champion_name: str, force_refresh: bool = False):
+        """Get champion meta stats (cached per champion)"""
+        return self._cached_scrape(
+            self._champ_cache, champion_name.strip().lower(),
+            lambda: self.champion_scraper.get_champion_stats(champion_name),
+            force_refresh, self._champ_disk_cache
+        )
+    
+    async def run_blocking(self, func, *args, **kwargs):
+        """Run a blocking call on the shared worker pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+    
+    async def _match_detail_pages(self, match_ids, region: str, page_size: int = MATCH_PAGE_SIZE):
+        """Yield [(match_id, details or None), ...] a page at a time, each page fetched concurrently
+
+        Callers open manual_storage.batch() per page, so a batch never stays open across an await
+        """
+        for start in range(0, len(match_ids), page_size):
+            page = match_ids[start:start + page_size]
+            details = await self.run_blocking(self.riot_scraper.get_multiple_match_details, page, region)
+            yield [(match_id, details.get(match_id)) for match_id in page]
+    
+    def _build_help_embed(self):
+        """Build the full !help embed (done once, on first use)"""
+        embed = discord.Embed(
+            title="🤖 ScoutLE Bot - All Commands",
+            description="**34 Commands** | League of Legends Stats Tracker\n"
+                       "✨ NEW: Team sync, space support, champion icons!\n"
+                       "Use `!help <command>` for detailed help on a specific command",
+            color=COLOR_GREEN
+        )
         
-        @self.bot.command(name='help')
-        async def help_command(ctx, command_name: str = None):
-            """Display help for commands"""
-            if command_name:
-                # Show help for specific command
-                command = self.bot.get_command(command_name)
-                if command:
-                    embed = discord.Embed(
-                        title=f"📖 Help: !{command_name}",
-                        description=command.help or "No description available",
-                        color=0x3498db
-                    )
-                    await ctx.send(embed=embed)
-                else:
-                    await ctx.send(f"❌ Command `{command_name}` not found!")
-                return
-            
-            embed = discord.Embed(
-                title="🤖 ScoutLE Bot - All Commands",
-                description="**34 Commands** | League of Legends Stats Tracker\n"
-                           "✨ NEW: Team sync, space support, champion icons!\n"
-                           "Use `!help <command>` for detailed help on a specific command",
-                color=0x00ff00
-            )
-            
-            embed.add_field(
-                name="📊 Player Stats & Registration (5 commands)",
-                value="""**`!register <riot_id> <region> [ranked_count] [custom_count]`** ⭐ AUTO!
+        embed.add_field(
+            name="📊 Player Stats & Registration (5 commands)",
+            value="""**`!register <riot_id> <region> [ranked_count] [custom_count]`** ⭐ AUTO!
 Registers player AND auto-fetches all stats!
 Example: `!register Odd#kimmy euw` (default: 50 ranked, 100 custom)
 Custom: `!register Odd#kimmy euw 100 200` (heavy scan)
@@ -163,12 +358,12 @@ Custom: `!register Odd#kimmy euw 100 200` (heavy scan)
 **`!stats <riot_id>`** - View complete stats (3 sections!)
 **`!ranked <riot_id>`** - View only ranked stats
 **`!manual <riot_id>`** - View only manual games""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🚀 Auto-Import Features (6 commands)",
-                value="""**`!sync <riot_id> [count]`** - Auto-import ranked games
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🚀 Auto-Import Features (6 commands)",
+            value="""**`!sync <riot_id> [count]`** - Auto-import ranked games
 Example: `!sync Odd#kimmy 20` (imports last 20 ranked games)
 
 **`!synccustom <riot_id> [count]`** - Auto-import custom/tournament games ⭐
@@ -184,12 +379,12 @@ Example: `!lastgame Odd#kimmy`
 Example: `!mastery Odd#kimmy` or `!mastery Odd#kimmy Zeri`
 
 **`!live <riot_id>`** - Check if player is in game (temporarily unavailable)""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="➕ Manual Game Management (4 commands)",
-                value="""**`!addgame <riot_id> <champ> <result> <k> <d> <a> <cs> <dur> [type]`**
+            inline=False
+        )
+        
+        embed.add_field(
+            name="➕ Manual Game Management (5 commands)",
+            value="""**`!addgame <riot_id> <champ> <result> <k> <d> <a> <cs> <dur> [type]`**
 Add game with full stats
 Example: `!addgame Odd#kimmy Zeri WIN 12 1 7 274 31 custom`
 
@@ -198,12 +393,12 @@ Example: `!addgameid Odd#kimmy EUW1_1234567890`
 
 **`!listgames <riot_id>`** - List all manual games
 **`!removegame <match_id>`** - Remove a specific game""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🏆 Champion Meta & Analysis (3 commands)",
-                value="""**`!champion <name>`** - Detailed champion stats (Diamond+)
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🏆 Champion Meta & Analysis (3 commands)",
+            value="""**`!champion <name>`** - Detailed champion stats (Diamond+)
 Shows: Win/Pick/Ban rates, Tier, Builds, Runes, Matchups
 Example: `!champion Zeri`
 
@@ -212,20 +407,20 @@ Example: `!matchup Zeri Jinx`
 
 **`!tier <champion>`** - Quick tier check
 Example: `!tier Zeri`""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="👥 Player Management (3 commands)",
-                value="""**`!players`** - List all registered players
+            inline=False
+        )
+        
+        embed.add_field(
+            name="👥 Player Management (3 commands)",
+            value="""**`!players`** - List all registered players
 **`!remove <riot_id>`** - Remove a player
 **`!clearstats <riot_id>`** - Clear a player's stats (keeps registration)""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🏆 Team System (7 commands)",
-                value="""**`!createteam <name>`** - Create a new team
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🏆 Team System (7 commands)",
+            value="""**`!createteam <name>`** - Create a new team
 **`!addtoteam <team> <riot_id>`** - Add player to team
 **`!removefromteam <team> <riot_id>`** - Remove player from team
 **`!viewteam <name>`** - View team roster & **combined** stats (Ranked + Custom)
@@ -234,42 +429,95 @@ Example: `!tier Zeri`""",
 Example: `!syncteam MainRoster` (default: 30 ranked, 50 custom)
 Custom: `!syncteam MainRoster 50 100` (sync all players!)
 **`!deleteteam <name>`** - Delete a team""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="🗑️ Clear Data (3 commands)",
-                value="""**`!clearstats <riot_id>`** - Clear one player's stats
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🗑️ Clear Data (3 commands)",
+            value="""**`!clearstats <riot_id>`** - Clear one player's stats
 **`!clearall confirm`** - Clear ALL stats (use !clearall first for warning)
 **`!unregisterall confirm`** - Unregister ALL players and delete ALL data""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="ℹ️ Help & Debug (4 commands)",
-                value="""**`!help`** - Show all commands (this message)
+            inline=False
+        )
+        
+        embed.add_field(
+            name="ℹ️ Help & Debug (4 commands)",
+            value="""**`!help`** - Show all commands (this message)
 **`!help <command>`** - Detailed help for specific command
 **`!debug <riot_id>`** - Show data sources for troubleshooting
 **`!matchhistory <riot_id> [count]`** - View match history with dates""",
-                inline=False
-            )
-            
-            embed.add_field(
-                name="💡 Quick Start Guide",
-                value="""1️⃣ Register: `!register YourName#TAG euw`
+            inline=False
+        )
+        
+        embed.add_field(
+            name="💡 Quick Start Guide",
+            value="""1️⃣ Register: `!register YourName#TAG euw`
 2️⃣ Fetch stats: `!update YourName#TAG`
 3️⃣ Or add manually: `!addgame YourName#TAG Zeri WIN 12 1 7 274 31`
 4️⃣ View stats: `!stats YourName#TAG`
 5️⃣ Check meta: `!champion Zeri`""",
-                inline=False
+            inline=False
+        )
+        
+        embed.set_footer(text="📝 Riot ID format: Name#TAG | Regions: euw, na, kr, eune, br, jp, ru, oce, tr, lan, las")
+        return embed
+    
+    def setup_events(self):
+        """Setup Discord event handlers"""
+        
+        @self.bot.event
+        async def on_ready():
+            logger.info("🤖 ScoutLE Bot is ready! Logged in as %s", self.bot.user)
+            logger.info("📊 Connected to %d server(s)", len(self.bot.guilds))
+            
+            activity = discord.Activity(
+                type=discord.ActivityType.watching, 
+                name="League stats | !help"
             )
+            await self.bot.change_presence(activity=activity)
+        
+        @self.bot.event
+        async def on_command_error(ctx, error):
+            if isinstance(error, commands.CommandNotFound):
+                await ctx.send("❌ Unknown command. Use `!help` to see available commands.")
+            elif isinstance(error, commands.MissingRequiredArgument):
+                await ctx.send(f"❌ Missing argument: {error.param}. Use `!help <command>` for more info.")
+            else:
+                await ctx.send(f"❌ Error: {str(error)}")
+                logger.error("Error: %s", error)
+    
+    def setup_commands(self):
+        """Setup Discord commands"""
+        
+        @self.bot.command(name='help')
+        async def help_command(ctx, command_name: str = None):
+            """Display help for commands"""
+            if command_name:
+                # Show help for specific command
+                command = self.bot.get_command(command_name)
+                if command:
+                    embed = discord.Embed(
+                        title=f"📖 Help: !{command_name}",
+                        description=command.help or "No description available",
+                        color=COLOR_BLUE
+                    )
+                    await ctx.send(embed=embed)
+                else:
+                    await ctx.send(f"❌ Command `{command_name}` not found!")
+                return
             
-            embed.set_footer(text="📝 Riot ID format: Name#TAG | Regions: euw, na, kr, eune, br, jp, ru, oce, tr, lan, las")
-            await ctx.send(embed=embed)
+            # The full command list never changes, so build it on first use and reuse it
+            if self._help_embed is None:
+                self._help_embed = self._build_help_embed()
+            await ctx.send(embed=self._help_embed)
         
         @self.bot.command(name='register')
         async def register_player(ctx, *, args: str):
             """Register a new player and auto-fetch all stats. Example: !register Odd#kimmy euw or !register Player Name#TAG euw"""
+            # One clock reading for the registration and every game this command adds
+            now = datetime.now()
+            import_date = now.strftime("%Y-%m-%d %H:%M:%S")
+            
             # Parse arguments (riot_id is required, rest are optional)
             parts = args.split()
             if len(parts) < 1:
@@ -290,9 +538,10 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                     remaining_parts.append(part)
             
             riot_id = ' '.join(riot_id_parts)
-            region = remaining_parts[0] if len(remaining_parts) > 0 else "euw"
-            ranked_games = int(remaining_parts[1]) if len(remaining_parts) > 1 else 50
-            custom_games = int(remaining_parts[2]) if len(remaining_parts) > 2 else 100
+            # Pad the optional arguments with their defaults and unpack them in one go
+            region, ranked_games, custom_games = (remaining_parts + ["euw", "50", "100"][len(remaining_parts):])[:3]
+            ranked_games = int(ranked_games)
+            custom_games = int(custom_games)
             region = region.lower()
             
             if riot_id in self.team_data["players"]:
@@ -310,14 +559,16 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 "region": region,
                 "discord_id": ctx.author.id,
                 "registered_by": ctx.author.name,
-                "registered_at": datetime.now().isoformat(),
+                "registered_at": now.isoformat(),
                 "last_updated": None,
                 "ranked_stats": None
             }
             self.save_team_data()
             
             # Auto-fetch stats
-            status_msg = await ctx.send(f"⏳ **Step 1/3:** Fetching ranked stats from Riot API...")
+            # Step updates go through ProgressMessage, which edits in place and coalesces quick successive steps
+            progress = ProgressMessage(ctx)
+            await progress.update("⏳ **Step 1/3:** Fetching ranked stats from Riot API...", force=True)
             
             # Initialize counters at the start
             synced = 0
@@ -325,183 +576,116 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             try:
                 # Step 1: Update ranked stats
-                account = self.riot_scraper.scrape_player_account(riot_id, region)
+                # The summoner lookup (used in step 2) doesn't depend on the ranked stats, so run it alongside
+                account, summoner_info = await asyncio.gather(
+                    self.run_blocking(self.get_player_account, riot_id, region),
+                    self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
+                )
                 
                 if account:
-                    ranked_stats = {
-                        "summoner_name": account.summoner_name,
-                        "level": account.level,
-                        "rank": {
-                            "soloq": account.soloq_rank,
-                            "flex": account.flex_rank,
-                            "soloq_lp": account.soloq_lp,
-                            "flex_lp": account.flex_lp
-                        },
-                        "champions": []
-                    }
-                    
-                    for perf in account.champion_performances:
-                        ranked_stats["champions"].append({
-                            "name": perf.champion_name,
-                            "games": perf.games_played,
-                            "wins": perf.wins,
-                            "losses": perf.losses,
-                            "win_rate": perf.win_rate,
-                            "kda": perf.kda,
-                            "kills": perf.kills,
-                            "deaths": perf.deaths,
-                            "assists": perf.assists,
-                            "cs_per_min": perf.cs_per_min
-                        })
+                    ranked_stats = self._ranked_stats_from_account(account)
                     
                     self.team_data["players"][riot_id]["ranked_stats"] = ranked_stats
                     self.team_data["players"][riot_id]["last_updated"] = datetime.now().isoformat()
                     self.save_team_data()
                     
-                    try:
-                        await status_msg.edit(content=f"✅ **Step 1/3:** Ranked stats fetched!\n⏳ **Step 2/3:** Importing last {ranked_games} ranked games...")
-                    except:
-                        await ctx.send(f"✅ **Step 1/3:** Ranked stats fetched!\n⏳ **Step 2/3:** Importing last {ranked_games} ranked games...")
+                    await progress.update(f"✅ **Step 1/3:** Ranked stats fetched!\n⏳ **Step 2/3:** Importing last {ranked_games} ranked games...")
                 else:
-                    try:
-                        await status_msg.edit(content=f"⚠️ **Step 1/3:** Could not fetch ranked stats (continuing anyway)\n⏳ **Step 2/3:** Importing ranked games...")
-                    except:
-                        await ctx.send(f"⚠️ **Step 1/3:** Could not fetch ranked stats (continuing anyway)\n⏳ **Step 2/3:** Importing ranked games...")
+                    await progress.update(f"⚠️ **Step 1/3:** Could not fetch ranked stats (continuing anyway)\n⏳ **Step 2/3:** Importing ranked games...")
                 
                 # Step 2: Sync ranked games
-                summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
                 if summoner_info:
-                    match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, ranked_games, queue=420)
+                    # Fetch the ranked and full match histories (used in step 3) together
+                    match_ids, all_match_ids = await asyncio.gather(
+                        self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, ranked_games, queue=420),
+                        self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, custom_games)
+                    )
                     
                     if match_ids:
-                        champion_mapping = self.riot_scraper.get_champion_data()
+                        champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+                        puuid = summoner_info['puuid']
                         synced = 0
                         
-                        for match_id in match_ids[:ranked_games]:
-                            # Add small async delay to prevent blocking
-                            if synced > 0 and synced % 10 == 0:
-                                await asyncio.sleep(0.1)
-                            
-                            match_details = self.riot_scraper.get_match_details(match_id, region)
-                            if not match_details:
-                                continue
-                            
-                            # Auto-add for all registered players in game
-                            for p in match_details['info']['participants']:
-                                if p['puuid'] == summoner_info['puuid']:
-                                    manual_match_id = f"SYNC_{match_id}"
-                                    if not any(m.match_id == manual_match_id for m in self.manual_storage.matches):
-                                        champion_name = champion_mapping.get(p['championId'], "Unknown")
-                                        match = ManualMatch(
-                                            match_id=manual_match_id,
-                                            summoner_name=riot_id,
-                                            champion_name=champion_name,
-                                            result="WIN" if p['win'] else "LOSS",
-                                            kills=float(p['kills']),
-                                            deaths=float(p['deaths']),
-                                            assists=float(p['assists']),
-                                            cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                                            game_duration=int(match_details['info']['gameDuration'] / 60),
-                                            queue_type="ranked",
-                                            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                            notes=f"Auto-synced during registration"
-                                        )
-                                        if self.manual_storage.add_match(match):
-                                            synced += 1
-                                    break
+                        async for page in self._match_detail_pages(match_ids[:ranked_games], region):
+                            with self.manual_storage.batch():  # One save per fetched page
+                                for match_id, match_details in page:
+                                    if not match_details:
+                                        continue
+                                    
+                                    # Auto-add for all registered players in game
+                                    for p in match_details['info']['participants']:
+                                        if p['puuid'] == puuid:
+                                            manual_match_id = f"SYNC_{match_id}"
+                                            if not self.manual_storage.has_match(manual_match_id):
+                                                champion_name = champion_mapping.get(p['championId'], "Unknown")
+                                                match = ManualMatch.from_participant(
+                                                    p, manual_match_id, riot_id, champion_name,
+                                                    game_duration_seconds=match_details['info']['gameDuration'],
+                                                    queue_type="ranked",
+                                                    date=import_date,
+                                                    notes="Auto-synced during registration"
+                                                )
+                                                if self.manual_storage.add_match(match):
+                                                    synced += 1
+                                            break
                         
-                        try:
-                            await status_msg.edit(content=f"✅ **Step 1/3:** Ranked stats fetched!\n✅ **Step 2/3:** {synced} ranked games imported!\n⏳ **Step 3/3:** Scanning for custom/tournament games...")
-                        except:
-                            await ctx.send(f"✅ **Step 2/3:** {synced} ranked games imported!\n⏳ **Step 3/3:** Scanning for custom games...")
+                        await progress.update(f"✅ **Step 1/3:** Ranked stats fetched!\n✅ **Step 2/3:** {synced} ranked games imported!\n⏳ **Step 3/3:** Scanning for custom/tournament games...")
                     else:
-                        try:
-                            await status_msg.edit(content=f"✅ **Step 1/3:** Ranked stats fetched!\n⚠️ **Step 2/3:** No ranked games found\n⏳ **Step 3/3:** Scanning for custom games...")
-                        except:
-                            await ctx.send(f"⚠️ **Step 2/3:** No ranked games found\n⏳ **Step 3/3:** Scanning for custom games...")
+                        await progress.update(f"✅ **Step 1/3:** Ranked stats fetched!\n⚠️ **Step 2/3:** No ranked games found\n⏳ **Step 3/3:** Scanning for custom games...")
                 
                 # Step 3: Scan custom games
                 if summoner_info:
-                    all_match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, custom_games)
                     custom_found = 0
                     
                     if all_match_ids:
-                        champion_mapping = self.riot_scraper.get_champion_data()
+                        champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+                        registered_by_name = self._registered_name_index()
                         
-                        for match_id in all_match_ids:
-                            # Add async delay every 10 games to prevent blocking
-                            if custom_found > 0 and custom_found % 10 == 0:
-                                await asyncio.sleep(0.1)
-                            
-                            match_details = self.riot_scraper.get_match_details(match_id, region)
-                            if not match_details:
-                                continue
-                            
-                            queue_id = match_details['info']['queueId']
-                            # ONLY detect true custom/tournament games
-                            # Queue 0 = Custom games (5v5 Draft/Blind)
-                            # Queue 2000-2020 = Tournament code games
-                            # NOTE: Excludes Clash (700), Arena (1700/3100), ARURF (900), etc.
-                            if queue_id != 0 and not (2000 <= queue_id <= 2020):
-                                continue
-                            
-                            custom_found += 1
-                            
-                            # Auto-add for all registered players
-                            for p in match_details['info']['participants']:
-                                p_game_name = p.get('riotIdGameName', p.get('summonerName', ''))
-                                p_tag = p.get('riotIdTagline', '')
-                                p_riot_id = f"{p_game_name}#{p_tag}" if p_tag else p_game_name
-                                
-                                is_registered = p_riot_id in self.team_data["players"]
-                                if not is_registered:
-                                    for registered_id in self.team_data["players"].keys():
-                                        if registered_id.split('#')[0].lower() == p_game_name.lower():
-                                            p_riot_id = registered_id
-                                            is_registered = True
-                                            break
-                                
-                                if is_registered:
-                                    p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
-                                    if not any(m.match_id == p_match_id for m in self.manual_storage.matches):
-                                        p_champion = champion_mapping.get(p['championId'], "Unknown")
+                        async for page in self._match_detail_pages(all_match_ids, region):
+                            with self.manual_storage.batch():  # One save per fetched page
+                                for match_id, match_details in page:
+                                    if not match_details:
+                                        continue
+                                    
+                                    queue_id = match_details['info']['queueId']
+                                    # ONLY detect true custom/tournament games
+                                    # Queue 0 = Custom games (5v5 Draft/Blind)
+                                    # Queue 2000-2020 = Tournament code games
+                                    # NOTE: Excludes Clash (700), Arena (1700/3100), ARURF (900), etc.
+                                    game_type = CUSTOM_IMPORT_GAME_TYPES.get(queue_id)
+                                    if game_type is None:
+                                        continue
+                                    
+                                    custom_found += 1
+                                    
+                                    # Auto-add for all registered players
+                                    for p in match_details['info']['participants']:
+                                        p_riot_id = self._match_registered_player(p, registered_by_name)
+                                        is_registered = p_riot_id is not None
                                         
-                                        # Determine game type based on queue ID
-                                        if queue_id == 0:
-                                            game_type = "custom"
-                                        elif 2000 <= queue_id <= 2020:
-                                            game_type = "tournament"
-                                        else:
-                                            game_type = "custom"  # Fallback
-                                        
-                                        match = ManualMatch(
-                                            match_id=p_match_id,
-                                            summoner_name=p_riot_id,
-                                            champion_name=p_champion,
-                                            result="WIN" if p['win'] else "LOSS",
-                                            kills=float(p['kills']),
-                                            deaths=float(p['deaths']),
-                                            assists=float(p['assists']),
-                                            cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                                            game_duration=int(match_details['info']['gameDuration'] / 60),
-                                            queue_type=game_type,
-                                            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                            notes=f"Auto-imported during registration"
-                                        )
-                                        if self.manual_storage.add_match(match):
-                                            if p_riot_id == riot_id:  # Only count for the player being registered
-                                                custom_imported += 1
-                
-                try:
-                    await status_msg.delete()
-                except:
-                    pass
+                                        if is_registered:
+                                            p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
+                                            if not self.manual_storage.has_match(p_match_id):
+                                                p_champion = champion_mapping.get(p['championId'], "Unknown")
+                                                
+                                                match = ManualMatch.from_participant(
+                                                    p, p_match_id, p_riot_id, p_champion,
+                                                    game_duration_seconds=match_details['info']['gameDuration'],
+                                                    queue_type=game_type,
+                                                    date=import_date,
+                                                    notes="Auto-imported during registration"
+                                                )
+                                                if self.manual_storage.add_match(match):
+                                                    if p_riot_id == riot_id:  # Only count for the player being registered
+                                                        custom_imported += 1
+                
+                await progress.delete()
                 
                 # Final result
                 embed = discord.Embed(
                     title="🎉 Player Registered & Stats Loaded!",
                     description=f"**{riot_id}** is ready to go!",
-                    color=0x00ff00
+                    color=COLOR_GREEN
                 )
                 
                 if account:
@@ -525,7 +709,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 
             except Exception as e:
                 await ctx.send(f"✅ Player registered but auto-scan failed: {str(e)}\nUse `!update {riot_id}` and `!sync {riot_id}` manually.")
-                print(f"❌ Registration auto-scan error: {e}")
+                logger.error("❌ Registration auto-scan error: %s", e)
         
         @self.bot.command(name='update')
         async def update_player(ctx, *, riot_id: str):
@@ -544,39 +728,15 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             await ctx.send(f"🔄 Fetching ranked stats for {riot_id}...")
             
-            # Fetch from Riot API
-            account = self.riot_scraper.scrape_player_account(riot_id, region)
+            # Fetch from Riot API (always bypass the cache, this is an explicit refresh)
+            account = await self.run_blocking(self.get_player_account, riot_id, region, force_refresh=True)
             
             if not account:
                 await ctx.send(f"❌ Could not fetch data for {riot_id}. Make sure the Riot ID is correct and API key is set.")
                 return
             
             # Store ranked stats
-            ranked_stats = {
-                "summoner_name": account.summoner_name,
-                "level": account.level,
-                "rank": {
-                    "soloq": account.soloq_rank,
-                    "flex": account.flex_rank,
-                    "soloq_lp": account.soloq_lp,
-                    "flex_lp": account.flex_lp
-                },
-                "champions": []
-            }
-            
-            for perf in account.champion_performances:
-                ranked_stats["champions"].append({
-                    "name": perf.champion_name,
-                    "games": perf.games_played,
-                    "wins": perf.wins,
-                    "losses": perf.losses,
-                    "win_rate": perf.win_rate,
-                    "kda": perf.kda,
-                    "kills": perf.kills,
-                    "deaths": perf.deaths,
-                    "assists": perf.assists,
-                    "cs_per_min": perf.cs_per_min
-                })
+            ranked_stats = self._ranked_stats_from_account(account)
             
             self.team_data["players"][riot_id]["ranked_stats"] = ranked_stats
             self.team_data["players"][riot_id]["last_updated"] = datetime.now().isoformat()
@@ -585,7 +745,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="✅ Stats Updated",
                 description=f"**{account.summoner_name}** (Level {account.level})",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             embed.add_field(name="SoloQ", value=f"{account.soloq_rank} ({account.soloq_lp} LP)", inline=True)
             embed.add_field(name="Flex", value=f"{account.flex_rank} ({account.flex_lp} LP)", inline=True)
@@ -608,25 +768,19 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send(f"❌ No data for {riot_id}. Use `!update {riot_id}` to fetch ranked stats or `!addgame` to add manual games.")
                 return
             
-            # Separate manual matches by type
-            ranked_manual_matches = [m for m in manual_matches if m.queue_type in ['ranked', 'other']]
-            custom_matches = [m for m in manual_matches if m.queue_type in ['custom', 'tournament', 'tournament_draft', 'scrim', 'clash', 'arena']]
-            
-            # Calculate stats for each category
-            # Ranked stats = ranked_stats from API + ranked games from manual storage
-            ranked_stats_combined = self._combine_stats(ranked_stats, ranked_manual_matches)
-            
-            # Custom stats = only custom/tournament games
-            custom_stats = self._get_stats_from_matches(custom_matches)
-            
-            # Combined = everything
-            combined_stats = self._combine_stats(ranked_stats, manual_matches)
+            # Aggregate and format all three sections on a worker thread, reusing the last result if nothing changed
+            sections_key = (riot_id, player_data.get("last_updated"), self.manual_storage.version)
+            sections = self._stats_sections_cache.get(sections_key)
+            if sections is None:
+                sections = await self.run_blocking(self._build_stats_sections, ranked_stats, manual_matches)
+                self._stats_sections_cache.set(sections_key, sections)
+            top_champs, ranked_text, custom_text, combined_text = sections
             
             # Create main embed
             embed = discord.Embed(
                 title=f"📊 Complete Stats - {riot_id}",
                 description=f"Region: {player_data['region'].upper()}",
-                color=0x0099ff
+                color=COLOR_LIGHT_BLUE
             )
             
             # Show rank if available
@@ -639,37 +793,19 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 )
             
             # SECTION 1: Ranked Stats (includes API ranked + synced ranked games)
-            if ranked_stats_combined:
-                total_ranked_games = sum(c['games'] for c in ranked_stats_combined)
-                total_ranked_wins = sum(c['wins'] for c in ranked_stats_combined)
-                ranked_wr = (total_ranked_wins / total_ranked_games * 100) if total_ranked_games > 0 else 0
-                
+            if ranked_text:
                 # Add champion icon for top champion
-                if ranked_stats_combined:
-                    top_champ = ranked_stats_combined[0]['name']
-                    icon_url = self.champion_scraper.get_champion_icon_url(top_champ)
-                    if icon_url:
-                        embed.set_thumbnail(url=icon_url)
-                    
-                    # Add second champion as author icon if exists
-                    if len(ranked_stats_combined) > 1:
-                        second_champ = ranked_stats_combined[1]['name']
-                        second_icon_url = self.champion_scraper.get_champion_icon_url(second_champ)
-                        if second_icon_url:
-                            embed.set_author(name=f"Most Played: {top_champ} & {second_champ}", icon_url=second_icon_url)
-                
-                ranked_text = f"**Overall:** {total_ranked_games}g | {ranked_wr:.1f}% WR | **{total_ranked_wins}W** {total_ranked_games - total_ranked_wins}L\n\n"
-                
-                for i, champ in enumerate(ranked_stats_combined[:5], 1):
-                    # Add visual indicators
-                    wr_emoji = "🟢" if champ['win_rate'] >= 50 else "🔴"
-                    kda_emoji = "⭐" if champ['kda'] >= 3.0 else ("✨" if champ['kda'] >= 2.0 else "")
-                    
-                    # Add clickable champion icon link
-                    champ_icon = self.champion_scraper.get_champion_icon_url(champ['name'])
-                    champ_name_display = f"[{champ['name']}]({champ_icon})" if champ_icon else f"**{champ['name']}**"
-                    
-                    ranked_text += f"{wr_emoji} {i}. {champ_name_display} - {champ['games']}g | {champ['win_rate']:.1f}% WR | {champ['kda']:.2f} KDA {kda_emoji}\n"
+                top_champ = top_champs[0]
+                icon_url = champion_icon_url(top_champ)
+                if icon_url:
+                    embed.set_thumbnail(url=icon_url)
+                
+                # Add second champion as author icon if exists
+                if len(top_champs) > 1:
+                    second_champ = top_champs[1]
+                    second_icon_url = champion_icon_url(second_champ)
+                    if second_icon_url:
+                        embed.set_author(name=f"Most Played: {top_champ} & {second_champ}", icon_url=second_icon_url)
                 
                 embed.add_field(
                     name="🎮 Ranked Games",
@@ -678,24 +814,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 )
             
             # SECTION 2: Custom/Tournament Stats
-            if custom_stats:
-                total_custom_games = sum(c['games'] for c in custom_stats)
-                total_custom_wins = sum(c['wins'] for c in custom_stats)
-                custom_wr = (total_custom_wins / total_custom_games * 100) if total_custom_games > 0 else 0
-                
-                custom_text = f"**Overall:** {total_custom_games}g | {custom_wr:.1f}% WR | **{total_custom_wins}W** {total_custom_games - total_custom_wins}L\n\n"
-                
-                for i, champ in enumerate(custom_stats[:5], 1):
-                    # Add visual indicators
-                    wr_emoji = "🟢" if champ['win_rate'] >= 50 else "🔴"
-                    kda_emoji = "⭐" if champ['kda'] >= 3.0 else ("✨" if champ['kda'] >= 2.0 else "")
-                    
-                    # Add clickable champion icon link
-                    champ_icon = self.champion_scraper.get_champion_icon_url(champ['name'])
-                    champ_name_display = f"[{champ['name']}]({champ_icon})" if champ_icon else f"**{champ['name']}**"
-                    
-                    custom_text += f"{wr_emoji} {i}. {champ_name_display} - {champ['games']}g | {champ['win_rate']:.1f}% WR | {champ['kda']:.2f} KDA {kda_emoji}\n"
-                
+            if custom_text:
                 embed.add_field(
                     name="🏆 Custom/Tournament Games",
                     value=custom_text,
@@ -703,24 +822,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 )
             
             # SECTION 3: Combined Stats
-            if combined_stats:
-                total_games = sum(c['games'] for c in combined_stats)
-                total_wins = sum(c['wins'] for c in combined_stats)
-                combined_wr = (total_wins / total_games * 100) if total_games > 0 else 0
-                
-                combined_text = f"**Overall:** {total_games}g | {combined_wr:.1f}% WR | **{total_wins}W** {total_games - total_wins}L\n\n"
-                
-                for i, champ in enumerate(combined_stats[:5], 1):
-                    # Add visual indicators
-                    wr_emoji = "🟢" if champ['win_rate'] >= 50 else "🔴"
-                    kda_emoji = "⭐" if champ['kda'] >= 3.0 else ("✨" if champ['kda'] >= 2.0 else "")
-                    
-                    # Add clickable champion icon link
-                    champ_icon = self.champion_scraper.get_champion_icon_url(champ['name'])
-                    champ_name_display = f"[{champ['name']}]({champ_icon})" if champ_icon else f"**{champ['name']}**"
-                    
-                    combined_text += f"{wr_emoji} {i}. {champ_name_display} - {champ['games']}g | {champ['win_rate']:.1f}% WR | {champ['kda']:.2f} KDA {kda_emoji}\n"
-                
+            if combined_text:
                 embed.add_field(
                     name="⭐ Combined Stats (All Games)",
                     value=combined_text,
@@ -751,7 +853,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title=f"🎮 Ranked Stats: {riot_id}",
                 description=f"Level {ranked_stats['level']} | {player_data['region'].upper()}",
-                color=0xffd700
+                color=COLOR_GOLD
             )
             
             embed.add_field(
@@ -762,10 +864,11 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             )
             
             if ranked_stats["champions"]:
-                champ_text = ""
-                for i, champ in enumerate(ranked_stats["champions"][:8], 1):
-                    champ_text += f"{i}. **{champ['name']}** - {champ['games']}g ({champ['win_rate']:.1f}% WR)\n"
-                    champ_text += f"   KDA: {champ['kda']:.2f} | CS/min: {champ['cs_per_min']:.1f}\n"
+                champ_text = "".join(
+                    f"{i}. **{champ['name']}** - {champ['games']}g ({champ['win_rate']:.1f}% WR)\n"
+                    f"   KDA: {champ['kda']:.2f} | CS/min: {champ['cs_per_min']:.1f}\n"
+                    for i, champ in enumerate(ranked_stats["champions"][:8], 1)
+                )
                 
                 embed.add_field(
                     name="🏆 Champion Pool",
@@ -790,14 +893,15 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title=f"📝 Manual Games: {riot_id}",
                 description=f"Total: {len(manual_matches)} games",
-                color=0x9b59b6
+                color=COLOR_PURPLE
             )
             
             if all_stats:
-                champ_text = ""
-                for i, champ in enumerate(all_stats[:8], 1):
-                    champ_text += f"{i}. **{champ['champion_name']}** - {champ['games_played']}g ({champ['win_rate']:.1f}% WR)\n"
-                    champ_text += f"   KDA: {champ['kda']:.2f} | CS/min: {champ['cs_per_min']:.1f}\n"
+                champ_text = "".join(
+                    f"{i}. **{champ['champion_name']}** - {champ['games_played']}g ({champ['win_rate']:.1f}% WR)\n"
+                    f"   KDA: {champ['kda']:.2f} | CS/min: {champ['cs_per_min']:.1f}\n"
+                    for i, champ in enumerate(all_stats[:8], 1)
+                )
                 
                 embed.add_field(
                     name="🏆 Champions",
@@ -816,8 +920,9 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send("❌ Result must be WIN or LOSS")
                 return
             
-            # Generate unique match ID
-            match_id = f"MANUAL_{riot_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            # Generate unique match ID (same clock reading as the stored date)
+            now = datetime.now()
+            match_id = f"MANUAL_{riot_id}_{now.strftime('%Y%m%d_%H%M%S')}"
             
             match = ManualMatch(
                 match_id=match_id,
@@ -830,7 +935,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 cs=cs,
                 game_duration=duration,
                 queue_type=queue_type,
-                date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                date=now.strftime("%Y-%m-%d %H:%M:%S"),
                 notes=f"Added by {ctx.author.name}"
             )
             
@@ -840,7 +945,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 embed = discord.Embed(
                     title="✅ Game Added",
                     description=f"**{champion}** - {result}",
-                    color=0x00ff00
+                    color=COLOR_GREEN
                 )
                 embed.add_field(name="Player", value=riot_id, inline=True)
                 embed.add_field(name="KDA", value=f"{kills}/{deaths}/{assists} ({match.kda:.2f})", inline=True)
@@ -855,6 +960,9 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='addgameid')
         async def add_game_by_id(ctx, riot_id: str, game_id: str):
             """Add a game by fetching it from Riot API. Example: !addgameid Faker#KR1 EUW1_1234567890"""
+            # One import timestamp for every game this command adds
+            import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             if riot_id not in self.team_data["players"]:
                 await ctx.send(f"❌ {riot_id} not registered!")
                 return
@@ -865,7 +973,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             region = player_data["region"]
             
             # Fetch match details
-            match_details = self.riot_scraper.get_match_details(game_id, region)
+            match_details = await self.run_blocking(self.riot_scraper.get_match_details, game_id, region)
             
             if not match_details:
                 await ctx.send("❌ Could not fetch game. Make sure the game ID is correct.")
@@ -878,7 +986,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             puuid = None
             if player_data.get("ranked_stats"):
                 # We need to fetch puuid from Riot API first
-                summoner_info = self.riot_scraper.get_summoner_by_name(summoner_name, region)
+                summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, summoner_name, region)
                 if summoner_info:
                     puuid = summoner_info['puuid']
             
@@ -894,7 +1002,8 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 return
             
             # Extract stats and AUTO-ADD FOR ALL REGISTERED PLAYERS
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+            registered_by_name = self._registered_name_index()
             
             queue_id = match_details['info']['queueId']
             queue_type = "ranked" if queue_id == 420 else ("custom" if queue_id == 0 else "other")
@@ -903,58 +1012,40 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             players_list = []
             
             # Check all participants and add for registered players
-            for p in match_details['info']['participants']:
-                # Try to match participant to registered players
-                p_game_name = p.get('riotIdGameName', p.get('summonerName', ''))
-                p_tag = p.get('riotIdTagline', '')
-                p_riot_id = f"{p_game_name}#{p_tag}" if p_tag else p_game_name
-                
-                # Check if this participant is registered
-                is_registered = p_riot_id in self.team_data["players"]
-                
-                # Also check without tag variations
-                if not is_registered:
-                    for registered_id in self.team_data["players"].keys():
-                        if registered_id.split('#')[0].lower() == p_game_name.lower():
-                            p_riot_id = registered_id
-                            is_registered = True
-                            break
-                
-                if is_registered:
-                    # Create match for this player
-                    p_match_id = f"GAME_{game_id}_{p_riot_id}"
-                    
-                    # Skip if already added
-                    if any(m.match_id == p_match_id for m in self.manual_storage.matches):
-                        continue
-                    
-                    p_champion = champion_mapping.get(p['championId'], f"Champion_{p['championId']}")
-                    
-                    p_match = ManualMatch(
-                        match_id=p_match_id,
-                        summoner_name=p_riot_id,
-                        champion_name=p_champion,
-                        result="WIN" if p['win'] else "LOSS",
-                        kills=float(p['kills']),
-                        deaths=float(p['deaths']),
-                        assists=float(p['assists']),
-                        cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                        game_duration=int(match_details['info']['gameDuration'] / 60),
-                        queue_type=queue_type,
-                        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        notes=f"Imported from game ID {game_id} by {ctx.author.name}"
-                    )
+            with self.manual_storage.batch():  # One save for the whole import
+                for p in match_details['info']['participants']:
+                    # Try to match participant to registered players
+                    p_riot_id = self._match_registered_player(p, registered_by_name)
+                    is_registered = p_riot_id is not None
                     
-                    if self.manual_storage.add_match(p_match):
-                        players_added += 1
-                        result_emoji = "✅" if p_match.result == "WIN" else "❌"
-                        players_list.append(f"{result_emoji} **{p_riot_id}** ({p_champion})")
+                    if is_registered:
+                        # Create match for this player
+                        p_match_id = f"GAME_{game_id}_{p_riot_id}"
+                        
+                        # Skip if already added
+                        if self.manual_storage.has_match(p_match_id):
+                            continue
+                        
+                        p_champion = champion_mapping.get(p['championId'], f"Champion_{p['championId']}")
+                        
+                        p_match = ManualMatch.from_participant(
+                            p, p_match_id, p_riot_id, p_champion,
+                            game_duration_seconds=match_details['info']['gameDuration'],
+                            queue_type=queue_type,
+                            date=import_date,
+                            notes=f"Imported from game ID {game_id} by {ctx.author.name}"
+                        )
+                        
+                        if self.manual_storage.add_match(p_match):
+                            players_added += 1
+                            result_emoji = "✅" if p_match.result == "WIN" else "❌"
+                            players_list.append(f"{result_emoji} **{p_riot_id}** ({p_champion})")
             
             if players_added > 0:
                 embed = discord.Embed(
                     title="✅ Game Imported for All Players",
                     description=f"Game ID: `{game_id}`",
-                    color=0x00ff00
+                    color=COLOR_GREEN
                 )
                 embed.add_field(name="Players Updated", value=str(players_added), inline=True)
                 embed.add_field(name="Queue Type", value=queue_type.capitalize(), inline=True)
@@ -974,32 +1065,31 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='listgames')
         async def list_games(ctx, *, riot_id: str):
             """List all manual games for a player. Example: !listgames Faker#KR1 or !listgames Player Name#TAG"""
-            matches = self.manual_storage.get_matches_for_summoner(riot_id)
+            total = self.manual_storage.count_matches_for_summoner(riot_id)
             
-            if not matches:
+            if not total:
                 await ctx.send(f"❌ No manual games for {riot_id}")
                 return
             
-            # Show in pages of 10
+            # Show in pages of 10, only the shown page is copied out of the storage
             page_size = 10
-            total_pages = (len(matches) + page_size - 1) // page_size
+            total_pages = (total + page_size - 1) // page_size
+            
+            # One description block instead of an embed field per game
+            lines = [f"Total: {total} games (Page 1/{total_pages})", ""]
+            for match in self.manual_storage.get_matches_for_summoner(riot_id, limit=page_size):
+                status = "✅" if match.result == "WIN" else "❌"
+                lines.append(
+                    f"{status} **{match.champion_name}** | KDA: {match.kills:.0f}/{match.deaths:.0f}/{match.assists:.0f} | CS: {match.cs:.0f}\n"
+                    f"ID: `{match.match_id}` | {match.date}\n"
+                )
             
             embed = discord.Embed(
                 title=f"📝 Manual Games: {riot_id}",
-                description=f"Total: {len(matches)} games (Page 1/{total_pages})",
-                color=0x3498db
+                description=self._join_lines(lines),
+                color=COLOR_BLUE
             )
             
-            for i, match in enumerate(matches[:page_size], 1):
-                status = "✅" if match.result == "WIN" else "❌"
-                embed.add_field(
-                    name=f"{status} {match.champion_name}",
-                    value=f"KDA: {match.kills:.0f}/{match.deaths:.0f}/{match.assists:.0f} | CS: {match.cs:.0f}\n"
-                          f"ID: `{match.match_id}`\n"
-                          f"Date: {match.date}",
-                    inline=False
-                )
-            
             embed.set_footer(text="Use !removegame <match_id> to remove a game")
             await ctx.send(embed=embed)
         
@@ -1018,7 +1108,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             """Show detailed champion stats from Lolalytics. Example: !champion Zeri or !champion Lee Sin"""
             await ctx.send(f"🔍 Fetching data for {champion_name}...")
             
-            stats = self.champion_scraper.get_champion_stats(champion_name)
+            stats = await self.run_blocking(self.get_champion_stats, champion_name)
             
             if not stats:
                 await ctx.send(f"❌ Could not find stats for {champion_name}")
@@ -1080,7 +1170,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed.set_footer(text="Data from Lolalytics (Diamond+ ranked)")
             
             # Try to add champion icon
-            icon_url = self.champion_scraper.get_champion_icon_url(champion_name)
+            icon_url = champion_icon_url(champion_name)
             if icon_url:
                 embed.set_thumbnail(url=icon_url)
             
@@ -1091,12 +1181,17 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             """Compare two champions in a matchup. Example: !matchup Zeri Jinx"""
             await ctx.send(f"⚔️ Analyzing {champion1} vs {champion2}...")
             
-            comparison = self.champion_scraper.compare_champions(champion1, champion2)
+            # Fetch both champions at the same time (each one is cached separately)
+            stats1, stats2 = await asyncio.gather(
+                self.run_blocking(self.get_champion_stats, champion1),
+                self.run_blocking(self.get_champion_stats, champion2)
+            )
             
-            if not comparison:
+            if not stats1 or not stats2:
                 await ctx.send("❌ Could not fetch matchup data")
                 return
             
+            comparison = self.champion_scraper.compare_stats(stats1, stats2)
             stats1 = comparison['champion1']
             stats2 = comparison['champion2']
             matchup_wr = comparison['matchup_winrate']
@@ -1132,13 +1227,13 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='tier')
         async def tier_rating(ctx, champion_name: str):
             """Quick tier check for a champion. Example: !tier Zeri"""
-            stats = self.champion_scraper.get_champion_stats(champion_name)
+            stats = await self.run_blocking(self.get_champion_stats, champion_name)
             
             if not stats:
                 await ctx.send(f"❌ Could not find {champion_name}")
                 return
             
-            tier_emoji = {"S": "🏆", "A": "⭐", "B": "👍", "C": "👌", "D": "👎"}.get(stats.tier[0], "❓")
+            tier_emoji = TIER_EMOJI.get(stats.tier[0], "❓")
             
             embed = discord.Embed(
                 title=f"{tier_emoji} {stats.champion_name} - {stats.tier} Tier",
@@ -1155,22 +1250,18 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send("❌ No players registered! Use `!register <riot_id> <region>`")
                 return
             
-            embed = discord.Embed(
-                title="👥 Registered Players",
-                color=0x9b59b6
-            )
-            
-            for riot_id, data in self.team_data["players"].items():
-                status = "✅" if data["ranked_stats"] else "⏳"
-                manual_count = len(self.manual_storage.get_matches_for_summoner(riot_id))
-                
-                embed.add_field(
-                    name=f"{status} {riot_id}",
-                    value=f"Region: {data['region'].upper()}\n"
-                          f"Manual games: {manual_count}",
-                    inline=True
-                )
-            
+            # One line per player in the description (fields cap out at 25 per embed)
+            lines = []
+            for riot_id, data in self.team_data["players"].items():
+                status = "✅" if data["ranked_stats"] else "⏳"
+                lines.append(f"{status} **{riot_id}** | {data['region'].upper()} | {self.manual_storage.count_matches_for_summoner(riot_id)} manual games")
+            
+            embed = discord.Embed(
+                title="👥 Registered Players",
+                description=self._join_lines(lines),
+                color=COLOR_PURPLE
+            )
+            
             await ctx.send(embed=embed)
         
         @self.bot.command(name='remove', aliases=['unregister'])
@@ -1186,8 +1277,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             has_ranked = self.team_data["players"][riot_id].get("ranked_stats") is not None
             
             # Remove from manual storage
-            self.manual_storage.matches = [m for m in self.manual_storage.matches if m.summoner_name != riot_id]
-            self.manual_storage.save_matches()
+            self.manual_storage.remove_matches_for_summoner(riot_id)
             
             # Remove from all teams
             teams_removed_from = []
@@ -1203,7 +1293,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="🗑️ Player Unregistered",
                 description=f"**{riot_id}** has been completely removed",
-                color=0xff6b35
+                color=COLOR_ORANGE
             )
             embed.add_field(name="Manual games deleted", value=str(manual_count), inline=True)
             embed.add_field(name="Ranked stats deleted", value="Yes" if has_ranked else "No", inline=True)
@@ -1231,7 +1321,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 embed = discord.Embed(
                     title="⚠️ WARNING - Unregister All Players",
                     description="This will **permanently delete EVERYTHING**!",
-                    color=0xe74c3c
+                    color=COLOR_RED
                 )
                 
                 embed.add_field(
@@ -1274,7 +1364,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="🗑️ Everything Deleted",
                 description="⚠️ All players and data have been permanently removed",
-                color=0xe74c3c
+                color=COLOR_RED
             )
             embed.add_field(name="Players unregistered", value=str(total_players), inline=True)
             embed.add_field(name="Games deleted", value=str(total_manual), inline=True)
@@ -1294,7 +1384,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="👥 Team Overview",
                 description=f"**{len(self.team_data['players'])}** players registered",
-                color=0xff6b35
+                color=COLOR_ORANGE
             )
             
             total_manual = 0
@@ -1318,6 +1408,9 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='sync')
         async def sync_recent_games(ctx, *, args: str):
             """Auto-import recent games from Riot API. Example: !sync Faker#KR1 20 or !sync Player Name#TAG 50"""
+            # One import timestamp for every game this command adds
+            import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             # Parse riot_id and count
             parts = args.split()
             riot_id_parts = []
@@ -1356,14 +1449,14 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send(f"🔄 Fetching last {count} ranked games for {riot_id}...")
             
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner {riot_id}")
                 return
             
             # Get match history (only ranked games for !sync)
             try:
-                match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, count, queue=420)
+                match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, count, queue=420)
             except Exception as e:
                 await ctx.send(f"❌ Error fetching match history: {str(e)}")
                 return
@@ -1373,86 +1466,74 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 return
             
             # Import each match
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+            puuid = summoner_info['puuid']
             imported = 0
             skipped = 0
             errors = 0
             
             # Show progress for large imports
-            if count > 50:
-                status_msg = await ctx.send(f"⏳ Importing {len(match_ids)} ranked games... (0% complete)")
-            
-            for i, match_id in enumerate(match_ids):
-                try:
-                    # Add async delay every 10 games to prevent blocking
-                    if i > 0 and i % 10 == 0:
-                        await asyncio.sleep(0.1)
-                    
-                    # Update progress for large imports
-                    if count > 50 and i > 0 and i % 20 == 0:
-                        percent = int((i / len(match_ids)) * 100)
+            progress = ProgressMessage(ctx) if count > 50 else None
+            if progress:
+                await progress.update(f"⏳ Importing {len(match_ids)} ranked games... (0% complete)")
+            
+            checked = 0
+            async for page in self._match_detail_pages(match_ids, region):
+                # Update progress for large imports (edits are rate limited by ProgressMessage)
+                if progress and checked:
+                    percent = int((checked / len(match_ids)) * 100)
+                    await progress.update(f"⏳ Imported {checked}/{len(match_ids)} games ({percent}%)...")
+                checked += len(page)
+                
+                with self.manual_storage.batch():  # One save per fetched page
+                    for match_id, match_details in page:
                         try:
-                            await status_msg.edit(content=f"⏳ Imported {i}/{len(match_ids)} games ({percent}%)...")
-                        except:
-                            pass  # Ignore connection errors
-                    
-                    match_details = self.riot_scraper.get_match_details(match_id, region)
-                    if not match_details:
-                        errors += 1
-                        continue
-                    
-                    # Find player in match
-                    participant = None
-                    for p in match_details['info']['participants']:
-                        if p['puuid'] == summoner_info['puuid']:
-                            participant = p
-                            break
-                    
-                    if not participant:
-                        continue
-                    
-                    # Check if already imported
-                    manual_match_id = f"SYNC_{match_id}"
-                    if any(m.match_id == manual_match_id for m in self.manual_storage.matches):
-                        skipped += 1
-                        continue
-                    
-                    # Create manual match
-                    champion_name = champion_mapping.get(participant['championId'], f"Champion_{participant['championId']}")
-                    match = ManualMatch(
-                        match_id=manual_match_id,
-                        summoner_name=riot_id,
-                        champion_name=champion_name,
-                        result="WIN" if participant['win'] else "LOSS",
-                        kills=float(participant['kills']),
-                        deaths=float(participant['deaths']),
-                        assists=float(participant['assists']),
-                        cs=float(participant['totalMinionsKilled'] + participant['neutralMinionsKilled']),
-                        game_duration=int(match_details['info']['gameDuration'] / 60),
-                        queue_type="ranked" if match_details['info']['queueId'] == 420 else "other",
-                        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        notes=f"Auto-synced by {ctx.author.name}"
-                    )
-                    
-                    if self.manual_storage.add_match(match):
-                        imported += 1
-                        
-                except Exception as e:
-                    errors += 1
-                    print(f"❌ Error processing match {match_id}: {e}")
-                    continue
+                            if not match_details:
+                                errors += 1
+                                continue
+                            
+                            # Find player in match
+                            participant = None
+                            for p in match_details['info']['participants']:
+                                if p['puuid'] == puuid:
+                                    participant = p
+                                    break
+                            
+                            if not participant:
+                                continue
+                            
+                            # Check if already imported
+                            manual_match_id = f"SYNC_{match_id}"
+                            if self.manual_storage.has_match(manual_match_id):
+                                skipped += 1
+                                continue
+                            
+                            # Create manual match
+                            champion_name = champion_mapping.get(participant['championId'], f"Champion_{participant['championId']}")
+                            match = ManualMatch.from_participant(
+                                participant, manual_match_id, riot_id, champion_name,
+                                game_duration_seconds=match_details['info']['gameDuration'],
+                                queue_type="ranked" if match_details['info']['queueId'] == 420 else "other",
+                                date=import_date,
+                                notes=f"Auto-synced by {ctx.author.name}"
+                            )
+                            
+                            if self.manual_storage.add_match(match):
+                                imported += 1
+                                
+                        except Exception as e:
+                            errors += 1
+                            logger.error("❌ Error processing match %s: %s", match_id, e)
+                            continue
             
             # Delete progress message if it exists
-            if count > 50:
-                try:
-                    await status_msg.delete()
-                except:
-                    pass
+            if progress:
+                await progress.delete()
             
             embed = discord.Embed(
                 title="✅ Ranked Games Synced",
                 description=f"Imported ranked games for **{riot_id}**",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             embed.add_field(name="Imported", value=str(imported), inline=True)
             embed.add_field(name="Skipped (already imported)", value=str(skipped), inline=True)
@@ -1472,10 +1553,13 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='importtournament')
         async def import_tournament(ctx, tournament_code: str, region: str = "euw"):
             """Import games from tournament code. Example: !importtournament EUW1234-CODE euw"""
+            # One import timestamp for every game this command adds
+            import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             await ctx.send(f"🔍 Fetching games from tournament code...")
             
             # Get match IDs from tournament code
-            match_ids = self.riot_scraper.get_tournament_matches(tournament_code, region)
+            match_ids = await self.run_blocking(self.riot_scraper.get_tournament_matches, tournament_code, region)
             
             if not match_ids:
                 await ctx.send(f"❌ No games found for tournament code `{tournament_code}`")
@@ -1483,59 +1567,55 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             await ctx.send(f"✅ Found {len(match_ids)} games! Importing...")
             
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+            all_details = await self.run_blocking(self.riot_scraper.get_multiple_match_details, match_ids, region)
             imported = 0
             games_info = []
             
-            for match_id in match_ids:
-                match_details = self.riot_scraper.get_match_details(match_id, region)
-                if not match_details:
-                    continue
-                
-                # Import for each participant
-                for participant in match_details['info']['participants']:
-                    # Find riot_id from participant
-                    summoner_name = participant['riotIdGameName'] if 'riotIdGameName' in participant else participant['summonerName']
-                    riot_id = summoner_name  # Simplified, could be enhanced
-                    
-                    # Check if already imported
-                    manual_match_id = f"TOURNAMENT_{match_id}_{participant['participantId']}"
-                    if any(m.match_id == manual_match_id for m in self.manual_storage.matches):
+            with self.manual_storage.batch():  # One save for the whole import
+                for match_id in match_ids:
+                    match_details = all_details.get(match_id)
+                    if not match_details:
                         continue
                     
-                    champion_name = champion_mapping.get(participant['championId'], f"Champion_{participant['championId']}")
-                    match = ManualMatch(
-                        match_id=manual_match_id,
-                        summoner_name=riot_id,
-                        champion_name=champion_name,
-                        result="WIN" if participant['win'] else "LOSS",
-                        kills=float(participant['kills']),
-                        deaths=float(participant['deaths']),
-                        assists=float(participant['assists']),
-                        cs=float(participant['totalMinionsKilled'] + participant['neutralMinionsKilled']),
-                        game_duration=int(match_details['info']['gameDuration'] / 60),
-                        queue_type="tournament",
-                        date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        notes=f"Tournament: {tournament_code}"
-                    )
-                    
-                    if self.manual_storage.add_match(match):
-                        imported += 1
-                        result_emoji = "✅" if match.result == "WIN" else "❌"
-                        games_info.append(f"{result_emoji} {champion_name} ({riot_id}) - {match.result}")
+                    # Import for each participant
+                    for participant in match_details['info']['participants']:
+                        # Find riot_id from participant
+                        summoner_name = participant['riotIdGameName'] if 'riotIdGameName' in participant else participant['summonerName']
+                        riot_id = summoner_name  # Simplified, could be enhanced
+                        
+                        # Check if already imported
+                        manual_match_id = f"TOURNAMENT_{match_id}_{participant['participantId']}"
+                        if self.manual_storage.has_match(manual_match_id):
+                            continue
+                        
+                        champion_name = champion_mapping.get(participant['championId'], f"Champion_{participant['championId']}")
+                        match = ManualMatch.from_participant(
+                            participant, manual_match_id, riot_id, champion_name,
+                            game_duration_seconds=match_details['info']['gameDuration'],
+                            queue_type="tournament",
+                            date=import_date,
+                            notes=f"Tournament: {tournament_code}"
+                        )
+                        
+                        if self.manual_storage.add_match(match):
+                            imported += 1
+                            if len(games_info) < 10:  # Only the first 10 are shown
+                                result_emoji = "✅" if match.result == "WIN" else "❌"
+                                games_info.append(f"{result_emoji} {champion_name} ({riot_id}) - {match.result}")
             
             embed = discord.Embed(
                 title="🏆 Tournament Games Imported",
                 description=f"Tournament Code: `{tournament_code}`",
-                color=0xffd700
+                color=COLOR_GOLD
             )
             embed.add_field(name="Games imported", value=str(imported), inline=True)
             embed.add_field(name="Total games", value=str(len(match_ids)), inline=True)
             
-            if games_info[:10]:  # Show first 10
+            if games_info:
                 embed.add_field(
                     name="Games",
-                    value="\n".join(games_info[:10]),
+                    value="\n".join(games_info),
                     inline=False
                 )
             
@@ -1546,6 +1626,9 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
         @self.bot.command(name='synccustom')
         async def sync_custom_games(ctx, *, args: str):
             """Auto-import custom/tournament games from match history. Example: !synccustom Odd#kimmy 50 or !synccustom Player Name#TAG 100"""
+            # One import timestamp for every game this command adds
+            import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             # Parse riot_id and count
             parts = args.split()
             riot_id_parts = []
@@ -1584,14 +1667,14 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send(f"🔍 Scanning last {count} games for custom/tournament games...")
             
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner {riot_id}")
                 return
             
             # Get match history (ALL games, not just ranked)
             try:
-                match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, count)
+                match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, count)
             except Exception as e:
                 await ctx.send(f"❌ Error fetching match history: {str(e)}")
                 return
@@ -1601,127 +1684,103 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 return
             
             # Scan for custom games
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+            puuid = summoner_info['puuid']
+            registered_by_name = self._registered_name_index()
             imported = 0
             skipped = 0
             custom_found = 0
             errors = 0
             
-            status_msg = await ctx.send(f"⏳ Checking {len(match_ids)} games... (0% complete)")
+            progress = ProgressMessage(ctx)
+            await progress.update(f"⏳ Checking {len(match_ids)} games... (0% complete)")
             
-            for i, match_id in enumerate(match_ids):
-                try:
-                    # Add async delay every 10 games to prevent blocking
-                    if i > 0 and i % 10 == 0:
-                        await asyncio.sleep(0.1)
-                        percent = int((i / len(match_ids)) * 100)
+            checked = 0
+            async for page in self._match_detail_pages(match_ids, region):
+                # Edits are rate limited by ProgressMessage, so report every page
+                if checked:
+                    percent = int((checked / len(match_ids)) * 100)
+                    await progress.update(f"⏳ Checked {checked}/{len(match_ids)} games ({percent}%)... Found {custom_found} custom games")
+                checked += len(page)
+                
+                with self.manual_storage.batch():  # One save per fetched page
+                    for match_id, match_details in page:
                         try:
-                            await status_msg.edit(content=f"⏳ Checked {i}/{len(match_ids)} games ({percent}%)... Found {custom_found} custom games")
-                        except:
-                            pass  # Ignore connection errors during progress updates
-                    
-                    match_details = self.riot_scraper.get_match_details(match_id, region)
-                    if not match_details:
-                        errors += 1
-                        continue
-                    
-                    # Check if it's a custom game
-                    # Queue ID 0 = Custom games (including tournament draft)
-                    # Only detect true custom/tournament games
-                    queue_id = match_details['info']['queueId']
-                    
-                    # Queue 0 = Custom games (5v5 Draft/Blind)
-                    # Queue 2000-2020 = Tournament code games
-                    # Excludes: Clash (700), Arena (1700/3100), ARURF (900), ARAM (450), etc.
-                    if queue_id != 0 and not (2000 <= queue_id <= 2020):
-                        continue
-                    
-                    custom_found += 1
-                    
-                    # Find player in match
-                    participant = None
-                    for p in match_details['info']['participants']:
-                        if p['puuid'] == summoner_info['puuid']:
-                            participant = p
-                            break
-                    
-                    if not participant:
-                        continue
-                    
-                    # Check if already imported for this player
-                    manual_match_id = f"CUSTOM_{match_id}_{riot_id}"
-                    if any(m.match_id == manual_match_id for m in self.manual_storage.matches):
-                        skipped += 1
-                        continue
-                    
-                    # Determine game type based on queue
-                    if queue_id == 0:
-                        game_type = "custom"
-                    elif 2000 <= queue_id <= 2020:
-                        game_type = "tournament"
-                    else:
-                        game_type = "tournament"
-                    
-                    # AUTO-ADD FOR ALL REGISTERED PLAYERS IN THE GAME
-                    players_added = 0
-                    for p in match_details['info']['participants']:
-                        # Try to match participant to registered players
-                        p_game_name = p.get('riotIdGameName', p.get('summonerName', ''))
-                        p_tag = p.get('riotIdTagline', '')
-                        p_riot_id = f"{p_game_name}#{p_tag}" if p_tag else p_game_name
-                        
-                        # Check if this participant is registered
-                        is_registered = p_riot_id in self.team_data["players"]
-                        
-                        # Also check without tag variations
-                        if not is_registered:
-                            for registered_id in self.team_data["players"].keys():
-                                if registered_id.split('#')[0].lower() == p_game_name.lower():
-                                    p_riot_id = registered_id
-                                    is_registered = True
+                            if not match_details:
+                                errors += 1
+                                continue
+                            
+                            # Check if it's a custom game
+                            # Queue ID 0 = Custom games (including tournament draft)
+                            # Only detect true custom/tournament games
+                            queue_id = match_details['info']['queueId']
+                            
+                            # Queue 0 = Custom games (5v5 Draft/Blind)
+                            # Queue 2000-2020 = Tournament code games
+                            # Excludes: Clash (700), Arena (1700/3100), ARURF (900), ARAM (450), etc.
+                            game_type = CUSTOM_IMPORT_GAME_TYPES.get(queue_id)
+                            if game_type is None:
+                                continue
+                            
+                            custom_found += 1
+                            
+                            # Find player in match
+                            participant = None
+                            for p in match_details['info']['participants']:
+                                if p['puuid'] == puuid:
+                                    participant = p
                                     break
-                        
-                        if is_registered:
-                            # Create match for this player
-                            p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
                             
-                            # Skip if already added
-                            if any(m.match_id == p_match_id for m in self.manual_storage.matches):
+                            if not participant:
                                 continue
                             
-                            p_champion = champion_mapping.get(p['championId'], f"Champion_{p['championId']}")
+                            # Check if already imported for this player
+                            manual_match_id = f"CUSTOM_{match_id}_{riot_id}"
+                            if self.manual_storage.has_match(manual_match_id):
+                                skipped += 1
+                                continue
                             
-                            p_match = ManualMatch(
-                                match_id=p_match_id,
-                                summoner_name=p_riot_id,
-                                champion_name=p_champion,
-                                result="WIN" if p['win'] else "LOSS",
-                                kills=float(p['kills']),
-                                deaths=float(p['deaths']),
-                                assists=float(p['assists']),
-                                cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                                game_duration=int(match_details['info']['gameDuration'] / 60),
-                                queue_type=game_type,
-                                date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                notes=f"Auto-imported (found {p_riot_id} in game)"
-                            )
+                            # AUTO-ADD FOR ALL REGISTERED PLAYERS IN THE GAME
+                            players_added = 0
+                            for p in match_details['info']['participants']:
+                                # Try to match participant to registered players
+                                p_riot_id = self._match_registered_player(p, registered_by_name)
+                                is_registered = p_riot_id is not None
+                                
+                                if is_registered:
+                                    # Create match for this player
+                                    p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
+                                    
+                                    # Skip if already added
+                                    if self.manual_storage.has_match(p_match_id):
+                                        continue
+                                    
+                                    p_champion = champion_mapping.get(p['championId'], f"Champion_{p['championId']}")
+                                    
+                                    p_match = ManualMatch.from_participant(
+                                        p, p_match_id, p_riot_id, p_champion,
+                                        game_duration_seconds=match_details['info']['gameDuration'],
+                                        queue_type=game_type,
+                                        date=import_date,
+                                        notes=f"Auto-imported (found {p_riot_id} in game)"
+                                    )
+                                    
+                                    if self.manual_storage.add_match(p_match):
+                                        players_added += 1
                             
-                            if self.manual_storage.add_match(p_match):
-                                players_added += 1
-                    
-                    if players_added > 0:
-                        imported += players_added
-                        
-                except Exception as e:
-                    errors += 1
-                    print(f"❌ Error processing match {match_id}: {e}")
-                    continue
+                            if players_added > 0:
+                                imported += players_added
+                                
+                        except Exception as e:
+                            errors += 1
+                            logger.error("❌ Error processing match %s: %s", match_id, e)
+                            continue
             
             # Final result
             embed = discord.Embed(
                 title="✅ Custom Games Scan Complete",
                 description=f"Scanned match history for **{riot_id}**",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             embed.add_field(name="Games Scanned", value=str(len(match_ids)), inline=True)
             embed.add_field(name="Custom Games Found", value=str(custom_found), inline=True)
@@ -1757,10 +1816,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             embed.set_footer(text="Custom games include tournament games with codes")
             
-            try:
-                await status_msg.delete()
-            except:
-                pass
+            await progress.delete()
             
             await ctx.send(embed=embed)
         
@@ -1781,18 +1837,18 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             await ctx.send(f"🔍 Fetching last game for {riot_id}...")
             
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner")
                 return
             
             # Get last game
-            match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, 1)
+            match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, 1)
             if not match_ids:
                 await ctx.send(f"❌ No recent games found")
                 return
             
-            match_details = self.riot_scraper.get_match_details(match_ids[0], region)
+            match_details = await self.run_blocking(self.riot_scraper.get_match_details, match_ids[0], region)
             if not match_details:
                 await ctx.send(f"❌ Could not fetch game details")
                 return
@@ -1809,10 +1865,10 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 return
             
             # Create detailed embed
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
             champion_name = champion_mapping.get(participant['championId'], "Unknown")
             result = "VICTORY" if participant['win'] else "DEFEAT"
-            color = 0x00ff00 if participant['win'] else 0xff0000
+            color = COLOR_GREEN if participant['win'] else COLOR_LOSS_RED
             
             # Add result emoji
             result_emoji = "✅" if participant['win'] else "❌"
@@ -1824,7 +1880,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             )
             
             # Add champion icon
-            icon_url = self.champion_scraper.get_champion_icon_url(champion_name)
+            icon_url = champion_icon_url(champion_name)
             if icon_url:
                 embed.set_thumbnail(url=icon_url)
             
@@ -1907,30 +1963,31 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send(f"❌ Invalid Riot ID format! Must include tag: `Name#TAG`")
                 return
             
+            # Note: Spectator endpoint might not be available with Personal API keys
+            # Answer right away instead of after a summoner lookup whose result would be thrown away
+            await ctx.send(f"⚠️ Live game detection temporarily unavailable due to API changes. Feature coming soon!")
+            return
+            
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner")
                 return
             
             # Check current game (using PUUID)
-            # Note: Spectator endpoint might not be available with Personal API keys
-            await ctx.send(f"⚠️ Live game detection temporarily unavailable due to API changes. Feature coming soon!")
-            return
-            
-            current_game = self.riot_scraper.get_current_game(summoner_info['puuid'], region)
+            current_game = await self.run_blocking(self.riot_scraper.get_current_game, summoner_info['puuid'], region)
             
             if not current_game:
                 embed = discord.Embed(
                     title=f"💤 {riot_id}",
                     description="Not currently in game",
-                    color=0x95a5a6
+                    color=COLOR_GREY
                 )
                 await ctx.send(embed=embed)
                 return
             
             # Parse game data
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
             
             # Find player's champion
             player_champion = None
@@ -1942,19 +1999,12 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             game_length = current_game['gameLength']
             game_duration = f"{game_length // 60}:{game_length % 60:02d}"
             
-            queue_types = {
-                420: "Ranked Solo/Duo",
-                440: "Ranked Flex",
-                450: "ARAM",
-                400: "Normal Draft",
-                430: "Normal Blind"
-            }
-            queue_name = queue_types.get(current_game['gameQueueConfigId'], "Custom/Other")
+            queue_name = LIVE_QUEUE_NAMES.get(current_game['gameQueueConfigId'], "Custom/Other")
             
             embed = discord.Embed(
                 title=f"🎮 {riot_id} is IN GAME!",
                 description=f"Playing **{player_champion}**",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             
             embed.add_field(name="Queue", value=queue_name, inline=True)
@@ -2016,24 +2066,20 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 return
             
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner")
                 return
             
             # Get masteries
-            masteries = self.riot_scraper.get_champion_masteries(summoner_info['puuid'], region)
+            masteries = await self.run_blocking(self.riot_scraper.get_champion_masteries, summoner_info['puuid'], region)
             if not masteries:
                 await ctx.send(f"❌ Could not fetch champion masteries")
                 return
             
-            champion_mapping = self.riot_scraper.get_champion_data()
-            id_to_name = champion_mapping
-            name_to_id = {v.lower(): k for k, v in champion_mapping.items()}
-            
             if champion_name:
-                # Show specific champion
-                champ_id = name_to_id.get(champion_name.lower())
+                # Show specific champion (the name -> ID index is built once alongside the champion mapping)
+                champ_id = await self.run_blocking(self.riot_scraper.get_champion_id, champion_name)
                 if not champ_id:
                     await ctx.send(f"❌ Champion {champion_name} not found")
                     return
@@ -2046,28 +2092,26 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 embed = discord.Embed(
                     title=f"🏆 {champion_name} Mastery",
                     description=f"Player: **{riot_id}**",
-                    color=0x00ff00
+                    color=COLOR_GREEN
                 )
                 embed.add_field(name="Level", value=str(mastery['championLevel']), inline=True)
                 embed.add_field(name="Points", value=f"{mastery['championPoints']:,}", inline=True)
                 embed.add_field(name="Chest", value="✅" if mastery['chestGranted'] else "❌", inline=True)
                 
             else:
-                # Show top masteries
-                embed = discord.Embed(
-                    title=f"🏆 Top Champion Masteries",
-                    description=f"Player: **{riot_id}**",
-                    color=0x00ff00
-                )
-                
+                # Show top masteries as one list instead of a field per champion
+                id_to_name = await self.run_blocking(self.riot_scraper.get_champion_data)
+                lines = [f"Player: **{riot_id}**\n"]
                 for i, mastery in enumerate(masteries[:10], 1):
                     champ_name = id_to_name.get(mastery['championId'], "Unknown")
                     chest = "✅" if mastery['chestGranted'] else "❌"
-                    embed.add_field(
-                        name=f"{i}. {champ_name}",
-                        value=f"Level {mastery['championLevel']} | {mastery['championPoints']:,} pts | Chest: {chest}",
-                        inline=False
-                    )
+                    lines.append(f"**{i}. {champ_name}** - Level {mastery['championLevel']} | {mastery['championPoints']:,} pts | Chest: {chest}")
+                
+                embed = discord.Embed(
+                    title=f"🏆 Top Champion Masteries",
+                    description="\n".join(lines),
+                    color=COLOR_GREEN
+                )
             
             await ctx.send(embed=embed)
         
@@ -2085,41 +2129,47 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title=f"🔍 Debug Info - {riot_id}",
                 description="Data source breakdown",
-                color=0x3498db
+                color=COLOR_BLUE
             )
             
             # Ranked stats from API
             if ranked_stats and ranked_stats.get("champions"):
-                ranked_text = f"**Champions from !update:** {len(ranked_stats['champions'])}\n"
-                for champ in ranked_stats['champions'][:10]:
-                    ranked_text += f"• {champ['name']}: {champ['games']}g, {champ['wins']}W {champ['losses']}L\n"
+                ranked_lines = [f"**Champions from !update:** {len(ranked_stats['champions'])}"]
+                ranked_lines.extend(
+                    f"• {champ['name']}: {champ['games']}g, {champ['wins']}W {champ['losses']}L"
+                    for champ in ranked_stats['champions'][:10]
+                )
                 embed.add_field(
                     name="📊 Ranked Stats (from API)",
-                    value=ranked_text,
+                    value="\n".join(ranked_lines),
                     inline=False
                 )
             
             # Manual matches breakdown
             if manual_matches:
-                ranked_manual = [m for m in manual_matches if m.queue_type in ['ranked', 'other']]
-                custom_manual = [m for m in manual_matches if m.queue_type in ['custom', 'tournament', 'tournament_draft', 'scrim']]
-                
-                manual_text = f"**Total manual games:** {len(manual_matches)}\n"
-                manual_text += f"• Ranked (from !sync): {len(ranked_manual)}\n"
-                manual_text += f"• Custom/Tournament: {len(custom_manual)}\n"
-                
-                # Show champions in manual
-                from collections import Counter
-                champ_counts = Counter([m.champion_name for m in manual_matches])
-                manual_text += f"\n**Champion breakdown:**\n"
+                ranked_manual = [m for m in manual_matches if m.queue_type in RANKED_QUEUE_TYPES]
+                custom_manual = [m for m in manual_matches if m.queue_type in DEBUG_CUSTOM_QUEUE_TYPES]
+                
+                manual_lines = [
+                    f"**Total manual games:** {len(manual_matches)}",
+                    f"• Ranked (from !sync): {len(ranked_manual)}",
+                    f"• Custom/Tournament: {len(custom_manual)}",
+                    "",
+                    "**Champion breakdown:**",
+                ]
+                
+                # Show champions in manual, queue counts per champion gathered in the same pass
+                champ_counts = Counter()
+                queue_counts = {}
+                for m in manual_matches:
+                    champ_counts[m.champion_name] += 1
+                    queue_counts.setdefault(m.champion_name, Counter())[m.queue_type] += 1
                 for champ, count in champ_counts.most_common(10):
-                    queue_types = [m.queue_type for m in manual_matches if m.champion_name == champ]
-                    queue_counts = Counter(queue_types)
-                    manual_text += f"• {champ}: {count}g {dict(queue_counts)}\n"
+                    manual_lines.append(f"• {champ}: {count}g {dict(queue_counts[champ])}")
                 
                 embed.add_field(
                     name="📝 Manual Matches",
-                    value=manual_text,
+                    value="\n".join(manual_lines),
                     inline=False
                 )
             
@@ -2162,35 +2212,36 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             await ctx.send(f"🔍 Fetching last {count} matches for {riot_id}...")
             
             # Get summoner info
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner")
                 return
             
             # Get match history
-            match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, count, queue=420)
+            match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, count, queue=420)
             if not match_ids:
                 await ctx.send(f"❌ No recent ranked games found")
                 return
             
-            champion_mapping = self.riot_scraper.get_champion_data()
-            
-            embed = discord.Embed(
-                title=f"📜 Match History - {riot_id}",
-                description=f"Last {len(match_ids)} ranked games",
-                color=0x3498db
+            # Fetch every game (and the champion names) up front instead of one request per row
+            match_ids = match_ids[:count]
+            champion_mapping, all_details = await asyncio.gather(
+                self.run_blocking(self.riot_scraper.get_champion_data),
+                self.run_blocking(self.riot_scraper.get_multiple_match_details, match_ids, region)
             )
+            puuid = summoner_info['puuid']
             
-            # Get details for each match
-            for i, match_id in enumerate(match_ids[:count], 1):
-                match_details = self.riot_scraper.get_match_details(match_id, region)
+            # One row per game, rendered as a single description instead of an embed field each
+            lines = [f"Last {len(match_ids)} ranked games", ""]
+            for i, match_id in enumerate(match_ids, 1):
+                match_details = all_details.get(match_id)
                 if not match_details:
                     continue
                 
                 # Find player
                 participant = None
                 for p in match_details['info']['participants']:
-                    if p['puuid'] == summoner_info['puuid']:
+                    if p['puuid'] == puuid:
                         participant = p
                         break
                 
@@ -2205,12 +2256,16 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 game_creation = match_details['info']['gameCreation']
                 game_date = datetime.fromtimestamp(game_creation / 1000).strftime('%Y-%m-%d %H:%M')
                 
-                embed.add_field(
-                    name=f"{i}. {result} - {champion_name}",
-                    value=f"KDA: {kda} | Date: {game_date}\nMatch ID: `{match_id[-10:]}`",
-                    inline=False
+                lines.append(
+                    f"**{i}. {result} - {champion_name}**\n"
+                    f"KDA: {kda} | Date: {game_date} | Match ID: `{match_id[-10:]}`"
                 )
             
+            embed = discord.Embed(
+                title=f"📜 Match History - {riot_id}",
+                description=self._join_lines(lines),
+                color=COLOR_BLUE
+            )
             embed.set_footer(text="Use this to verify which games were counted")
             await ctx.send(embed=embed)
         
@@ -2246,86 +2301,66 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             await ctx.send(f"🔍 Scanning queue types in last {count} games...")
             
-            summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+            summoner_info = await self.run_blocking(self.riot_scraper.get_summoner_by_name, riot_id, region)
             if not summoner_info:
                 await ctx.send(f"❌ Could not find summoner")
                 return
             
             # Get ALL games (no queue filter)
-            match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, count)
+            match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, count)
             if not match_ids:
                 await ctx.send(f"❌ No games found")
                 return
             
-            champion_mapping = self.riot_scraper.get_champion_data()
+            champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+            puuid = summoner_info['puuid']
             queue_breakdown = {}
             game_details = []
             
             for i, match_id in enumerate(match_ids[:count]):
-                if i > 0 and i % 10 == 0:
-                    await asyncio.sleep(0.1)
-                
-                match_details = self.riot_scraper.get_match_details(match_id, region)
+                match_details = await self.run_blocking(self.riot_scraper.get_match_details, match_id, region)
                 if not match_details:
                     continue
                 
                 queue_id = match_details['info']['queueId']
                 queue_breakdown[queue_id] = queue_breakdown.get(queue_id, 0) + 1
                 
-                # Get champion and date for custom/tournament games
-                if queue_id in [0, 700, 1700, 2000, 2010, 2020, 3100]:
+                # Get champion and date for custom/tournament games (only the first 10 are shown)
+                if queue_id in CUSTOM_QUEUE_IDS and len(game_details) < 10:
                     for p in match_details['info']['participants']:
-                        if p['puuid'] == summoner_info['puuid']:
+                        if p['puuid'] == puuid:
                             champ = champion_mapping.get(p['championId'], "Unknown")
                             game_date = datetime.fromtimestamp(match_details['info']['gameCreation'] / 1000).strftime('%Y-%m-%d')
                             result = "WIN" if p['win'] else "LOSS"
-                            queue_name = queue_names.get(queue_id, f"ID {queue_id}")
+                            queue_name = QUEUE_NAMES.get(queue_id, f"ID {queue_id}")
                             game_details.append(f"• {queue_name}: {champ} ({result}) - {game_date}")
                             break
             
             embed = discord.Embed(
                 title=f"🔍 Queue Type Analysis - {riot_id}",
                 description=f"Scanned {len(match_ids)} games",
-                color=0x3498db
+                color=COLOR_BLUE
             )
             
-            # Queue ID reference
-            queue_names = {
-                0: "Custom",
-                420: "Ranked Solo/Duo",
-                440: "Ranked Flex",
-                450: "ARAM",
-                400: "Normal Draft",
-                430: "Normal Blind",
-                700: "Clash",
-                1700: "Tournament Draft / Arena",
-                2000: "Tutorial 1",
-                2010: "Tutorial 2",
-                2020: "Tutorial 3",
-                3100: "Cherry (Arena 2v2v2v2)"
-            }
-            
-            breakdown_text = ""
-            custom_queue_ids = [0, 700, 1700, 2000, 2010, 2020, 3100]
-            
+            breakdown_lines = []
             for queue_id in sorted(queue_breakdown.keys()):
                 count_games = queue_breakdown[queue_id]
-                queue_name = queue_names.get(queue_id, f"Unknown ({queue_id})")
+                queue_name = QUEUE_NAMES.get(queue_id, f"Unknown ({queue_id})")
                 
                 # Mark which queues are imported by !synccustom
-                if queue_id in custom_queue_ids:
-                    breakdown_text += f"✅ **{queue_name}** (ID: {queue_id}): {count_games} games ← Imported by !synccustom\n"
+                if queue_id in CUSTOM_QUEUE_IDS:
+                    breakdown_lines.append(f"✅ **{queue_name}** (ID: {queue_id}): {count_games} games ← Imported by !synccustom")
                 else:
-                    breakdown_text += f"**{queue_name}** (ID: {queue_id}): {count_games} games\n"
+                    breakdown_lines.append(f"**{queue_name}** (ID: {queue_id}): {count_games} games")
             
             embed.add_field(
                 name="📊 Queue Breakdown",
-                value=breakdown_text if breakdown_text else "No games found",
+                value="\n".join(breakdown_lines) if breakdown_lines else "No games found",
                 inline=False
             )
             
             if game_details:
-                custom_text = "\n".join(game_details[:10])
+                custom_text = "\n".join(game_details)
                 embed.add_field(
                     name="🎮 Custom Games Found",
                     value=custom_text,
@@ -2354,19 +2389,19 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             manual_count = len(manual_matches)
             
             # Remove from manual storage
-            original_count = len(self.manual_storage.matches)
-            self.manual_storage.matches = [m for m in self.manual_storage.matches if m.summoner_name != riot_id]
-            self.manual_storage.save_matches()
+            self.manual_storage.remove_matches_for_summoner(riot_id)
             
-            # Clear ranked stats
-            self.team_data["players"][riot_id]["ranked_stats"] = None
-            self.team_data["players"][riot_id]["last_updated"] = None
-            self.save_team_data()
+            # Clear ranked stats (already cleared players don't need another save)
+            player_data = self.team_data["players"][riot_id]
+            if player_data["ranked_stats"] is not None or player_data["last_updated"] is not None:
+                player_data["ranked_stats"] = None
+                player_data["last_updated"] = None
+                self.save_team_data()
             
             embed = discord.Embed(
                 title="🗑️ Stats Cleared",
                 description=f"All stats cleared for **{riot_id}**",
-                color=0xff6b35
+                color=COLOR_ORANGE
             )
             embed.add_field(name="Manual games removed", value=str(manual_count), inline=True)
             embed.add_field(name="Ranked stats", value="Cleared", inline=True)
@@ -2382,7 +2417,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 embed = discord.Embed(
                     title="⚠️ WARNING - Clear All Stats",
                     description="This will **permanently delete ALL stats** for ALL players!",
-                    color=0xe74c3c
+                    color=COLOR_RED
                 )
                 
                 total_manual = len(self.manual_storage.matches)
@@ -2420,16 +2455,20 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             # Clear all manual matches
             self.manual_storage.clear_all_matches()
             
-            # Clear all ranked stats
-            for riot_id in self.team_data["players"]:
-                self.team_data["players"][riot_id]["ranked_stats"] = None
-                self.team_data["players"][riot_id]["last_updated"] = None
-            self.save_team_data()
+            # Clear all ranked stats (only rewrite the file if something changed)
+            changed = False
+            for player_data in self.team_data["players"].values():
+                if player_data["ranked_stats"] is not None or player_data["last_updated"] is not None:
+                    player_data["ranked_stats"] = None
+                    player_data["last_updated"] = None
+                    changed = True
+            if changed:
+                self.save_team_data()
             
             embed = discord.Embed(
                 title="🗑️ All Stats Cleared",
                 description="⚠️ All statistics have been permanently deleted",
-                color=0xe74c3c
+                color=COLOR_RED
             )
             embed.add_field(name="Manual games removed", value=str(total_manual), inline=True)
             embed.add_field(name="Players affected", value=str(total_players), inline=True)
@@ -2465,7 +2504,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="✅ Team Created",
                 description=f"Team **{team_name}** has been created!",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             embed.add_field(name="Created by", value=ctx.author.name, inline=True)
             embed.set_footer(text="Use !addtoteam to add players")
@@ -2493,7 +2532,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="✅ Player Added to Team",
                 description=f"**{riot_id}** → Team **{team_name}**",
-                color=0x00ff00
+                color=COLOR_GREEN
             )
             embed.add_field(name="Team Size", value=str(len(self.team_data["teams"][team_name]["players"])), inline=True)
             
@@ -2532,50 +2571,41 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 title=f"👥 Team: {team_name}",
                 description=f"**{len(team['players'])}** players in roster\n"
                            f"📊 *Showing: **Combined Stats** (Ranked + Custom/Tournament)*",
-                color=0x3498db
+                color=COLOR_BLUE
             )
             
-            # Calculate team stats (combined)
+            # Calculate team stats (combined) on a worker thread, only the embed is built here.
+            # Commands on the loop can edit the roster and player data meanwhile, so the worker gets copies
+            players = self.team_data["players"]
+            roster_snapshot = [
+                (riot_id, copy.deepcopy(players[riot_id].get("ranked_stats")),
+                 self.manual_storage.get_matches_for_summoner(riot_id))
+                for riot_id in team["players"] if riot_id in players
+            ]
+            roster = await self.run_blocking(self._team_roster_stats, roster_snapshot)
+            
             total_games = 0
             total_wins = 0
             total_ranked_games = 0
             total_custom_games = 0
             
-            roster_text = ""
-            for riot_id in team["players"]:
-                if riot_id in self.team_data["players"]:
-                    player_data = self.team_data["players"][riot_id]
-                    manual_matches = self.manual_storage.get_matches_for_summoner(riot_id)
-                    
-                    # Count ranked games
-                    ranked_game_count = 0
-                    if player_data.get("ranked_stats") and player_data["ranked_stats"].get("champions"):
-                        for champ in player_data["ranked_stats"]["champions"]:
-                            ranked_game_count += champ.get("games", 0)
-                    
-                    # Count custom/tournament games
-                    custom_game_count = len([m for m in manual_matches if m.queue_type in ['custom', 'tournament', 'tournament_draft', 'clash']])
+            roster_lines = []
+            for riot_id, player_games, player_wins, ranked_game_count, custom_game_count in roster:
+                if player_games is not None:
+                    player_wr = (player_wins / player_games * 100) if player_games > 0 else 0
                     
-                    # Get combined stats
-                    combined = self._combine_stats(player_data.get("ranked_stats"), manual_matches)
+                    total_games += player_games
+                    total_wins += player_wins
+                    total_ranked_games += ranked_game_count
+                    total_custom_games += custom_game_count
                     
-                    if combined:
-                        player_games = sum(c['games'] for c in combined)
-                        player_wins = sum(c['wins'] for c in combined)
-                        player_wr = (player_wins / player_games * 100) if player_games > 0 else 0
-                        
-                        total_games += player_games
-                        total_wins += player_wins
-                        total_ranked_games += ranked_game_count
-                        total_custom_games += custom_game_count
-                        
-                        # Show breakdown for each player
-                        wr_indicator = "🟢" if player_wr >= 50 else "🔴"
-                        roster_text += f"{wr_indicator} **{riot_id}**\n"
-                        roster_text += f"   └ {player_games}g total | {player_wr:.1f}% WR\n"
-                        roster_text += f"   └ {ranked_game_count} ranked + {custom_game_count} custom\n"
-                    else:
-                        roster_text += f"⚪ **{riot_id}** - No stats\n"
+                    # Show breakdown for each player
+                    wr_indicator = WR_EMOJI[player_wr >= 50]
+                    roster_lines.append(f"{wr_indicator} **{riot_id}**")
+                    roster_lines.append(f"   └ {player_games}g total | {player_wr:.1f}% WR")
+                    roster_lines.append(f"   └ {ranked_game_count} ranked + {custom_game_count} custom")
+                else:
+                    roster_lines.append(f"⚪ **{riot_id}** - No stats")
             
             embed.add_field(
                 name="📊 Combined Team Stats",
@@ -2589,7 +2619,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             embed.add_field(
                 name="👥 Player Breakdown",
-                value=roster_text if roster_text else "No players",
+                value="\n".join(roster_lines) if roster_lines else "No players",
                 inline=False
             )
             
@@ -2606,20 +2636,17 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 await ctx.send("❌ No teams created! Use `!createteam <name>` to create one")
                 return
             
+            # One line per team in the description (fields cap out at 25 per embed)
+            lines = [f"**{len(teams)}** teams created\n"]
+            for team_name, team in teams.items():
+                lines.append(f"👥 **{team_name}** | {len(team['players'])} players | by {team['created_by']}")
+            
             embed = discord.Embed(
                 title="🏆 All Teams",
-                description=f"**{len(teams)}** teams created",
-                color=0x9b59b6
+                description=self._join_lines(lines),
+                color=COLOR_PURPLE
             )
             
-            for team_name, team in teams.items():
-                player_count = len(team["players"])
-                embed.add_field(
-                    name=f"👥 {team_name}",
-                    value=f"Players: {player_count}\nCreated by: {team['created_by']}",
-                    inline=True
-                )
-            
             embed.set_footer(text="Use !viewteam <name> to see roster")
             
             await ctx.send(embed=embed)
@@ -2639,7 +2666,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title="🗑️ Team Deleted",
                 description=f"Team **{team_name}** has been deleted",
-                color=0xff6b35
+                color=COLOR_ORANGE
             )
             embed.add_field(name="Players removed from team", value=str(player_count), inline=True)
             embed.set_footer(text="Players are still registered individually")
@@ -2686,7 +2713,7 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             embed = discord.Embed(
                 title=f"🔄 Syncing Team: {team_name}",
                 description=f"Auto-importing games for **{total_players}** players...",
-                color=0x3498db
+                color=COLOR_BLUE
             )
             embed.add_field(name="Ranked games per player", value=str(ranked_count), inline=True)
             embed.add_field(name="Custom games scan", value=str(custom_count), inline=True)
@@ -2694,163 +2721,134 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
             
             await ctx.send(embed=embed)
             
+            # One import timestamp for every game this sync adds
+            import_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
             # Sync each player
             total_ranked_imported = 0
             total_custom_imported = 0
             players_updated = 0
             errors_encountered = []
             
+            # One status message for the whole sync, edited as players finish
+            progress = ProgressMessage(ctx)
+            progress_lines = []
+            
+            async def update_status(current: str = None):
+                lines = progress_lines[-15:]  # Stay well under Discord's message limit
+                if current:
+                    lines = lines + [current]
+                await progress.update("\n".join(lines))
+            
+            registered_by_name = self._registered_name_index()
+            
+            # Look up every registered player's summoner concurrently up front,
+            # instead of one round-trip at the start of each player's sync
+            registered_ids = [r for r in team["players"] if r in self.team_data["players"]]
+            lookups = await asyncio.gather(
+                *(self.run_blocking(self.riot_scraper.get_summoner_by_name, r, self.team_data["players"][r]["region"])
+                  for r in registered_ids),
+                return_exceptions=True
+            )
+            summoner_infos = dict(zip(registered_ids, lookups))
+            
             for player_idx, riot_id in enumerate(team["players"], 1):
-                status_msg = None
                 try:
-                    status_msg = await ctx.send(f"⏳ Syncing player {player_idx}/{total_players}: {riot_id}...")
+                    await update_status(f"⏳ Syncing player {player_idx}/{total_players}: {riot_id}...")
                     
                     if riot_id not in self.team_data["players"]:
-                        try:
-                            await status_msg.edit(content=f"⚠️ Skipping {riot_id} (not registered)")
-                        except:
-                            await ctx.send(f"⚠️ Skipping {riot_id} (not registered)")
+                        progress_lines.append(f"⚠️ Skipping {riot_id} (not registered)")
+                        await update_status()
                         continue
                     
                     player_data = self.team_data["players"][riot_id]
                     region = player_data["region"]
                     
-                    # Get summoner info
-                    summoner_info = self.riot_scraper.get_summoner_by_name(riot_id, region)
+                    # Summoner info was prefetched above (a failed lookup is re-raised here)
+                    summoner_info = summoner_infos.get(riot_id)
+                    if isinstance(summoner_info, Exception):
+                        raise summoner_info
                     if not summoner_info:
-                        try:
-                            await status_msg.edit(content=f"⚠️ Could not find {riot_id}")
-                        except:
-                            await ctx.send(f"⚠️ Could not find {riot_id}")
+                        progress_lines.append(f"⚠️ Could not find {riot_id}")
+                        await update_status()
                         continue
                     
-                    await asyncio.sleep(0.1)  # Prevent event loop blocking
-                    
                     # Sync ranked games
-                    match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, ranked_count, queue=420)
+                    match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, ranked_count, queue=420)
                     ranked_synced = 0
                     
-                    await asyncio.sleep(0.1)  # Prevent event loop blocking
-                    
                     if match_ids:
-                        champion_mapping = self.riot_scraper.get_champion_data()
-                        for idx, match_id in enumerate(match_ids):
-                            match_details = self.riot_scraper.get_match_details(match_id, region)
-                            if not match_details:
-                                continue
-                            
-                            # Async sleep every 10 matches to prevent blocking
-                            if idx % 10 == 0:
-                                await asyncio.sleep(0.1)
-                            
-                            for p in match_details['info']['participants']:
-                                if p['puuid'] == summoner_info['puuid']:
-                                    manual_match_id = f"SYNC_{match_id}"
-                                    if not any(m.match_id == manual_match_id for m in self.manual_storage.matches):
-                                        champion_name = champion_mapping.get(p['championId'], "Unknown")
-                                        match = ManualMatch(
-                                            match_id=manual_match_id,
-                                            summoner_name=riot_id,
-                                            champion_name=champion_name,
-                                            result="WIN" if p['win'] else "LOSS",
-                                            kills=float(p['kills']),
-                                            deaths=float(p['deaths']),
-                                            assists=float(p['assists']),
-                                            cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                                            game_duration=int(match_details['info']['gameDuration'] / 60),
-                                            queue_type="ranked",
-                                            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                            notes=f"Team sync"
-                                        )
-                                        if self.manual_storage.add_match(match):
-                                            ranked_synced += 1
-                                    break
+                        champion_mapping = await self.run_blocking(self.riot_scraper.get_champion_data)
+                        puuid = summoner_info['puuid']
+                        async for page in self._match_detail_pages(match_ids, region):
+                            with self.manual_storage.batch():  # One save per fetched page
+                                for match_id, match_details in page:
+                                    if not match_details:
+                                        continue
+                                    
+                                    for p in match_details['info']['participants']:
+                                        if p['puuid'] == puuid:
+                                            manual_match_id = f"SYNC_{match_id}"
+                                            if not self.manual_storage.has_match(manual_match_id):
+                                                champion_name = champion_mapping.get(p['championId'], "Unknown")
+                                                match = ManualMatch.from_participant(
+                                                    p, manual_match_id, riot_id, champion_name,
+                                                    game_duration_seconds=match_details['info']['gameDuration'],
+                                                    queue_type="ranked",
+                                                    date=import_date,
+                                                    notes="Team sync"
+                                                )
+                                                if self.manual_storage.add_match(match):
+                                                    ranked_synced += 1
+                                            break
                     
                     total_ranked_imported += ranked_synced
                     
-                    await asyncio.sleep(0.1)  # Prevent event loop blocking
-                    
                     # Scan custom games (simplified, don't import all to save time)
-                    custom_match_ids = self.riot_scraper.get_match_history(summoner_info['puuid'], region, min(custom_count, 100))
+                    custom_match_ids = await self.run_blocking(self.riot_scraper.get_match_history, summoner_info['puuid'], region, min(custom_count, 100))
                     custom_synced = 0
                     
-                    await asyncio.sleep(0.1)  # Prevent event loop blocking
-                    
                     if custom_match_ids:
-                        for c_idx, match_id in enumerate(custom_match_ids[:50]):  # Limit to 50 for team sync
-                            match_details = self.riot_scraper.get_match_details(match_id, region)
-                            if not match_details:
-                                continue
-                            
-                            # Async sleep every 10 matches to prevent blocking
-                            if c_idx % 10 == 0:
-                                await asyncio.sleep(0.1)
-                            
-                            queue_id = match_details['info']['queueId']
-                            # ONLY detect true custom/tournament games
-                            # Queue 0 = Custom, Queue 2000-2020 = Tournament codes
-                            # Excludes Clash, Arena, ARURF, and other RGMs
-                            if queue_id != 0 and not (2000 <= queue_id <= 2020):
-                                continue
-                            
-                            # Auto-add for all registered players in game
-                            for p in match_details['info']['participants']:
-                                p_game_name = p.get('riotIdGameName', p.get('summonerName', ''))
-                                p_tag = p.get('riotIdTagline', '')
-                                p_riot_id = f"{p_game_name}#{p_tag}" if p_tag else p_game_name
-                                
-                                is_registered = p_riot_id in self.team_data["players"]
-                                if not is_registered:
-                                    for registered_id in self.team_data["players"].keys():
-                                        if registered_id.split('#')[0].lower() == p_game_name.lower():
-                                            p_riot_id = registered_id
-                                            is_registered = True
-                                            break
-                                
-                                if is_registered:
-                                    p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
-                                    if not any(m.match_id == p_match_id for m in self.manual_storage.matches):
-                                        p_champion = champion_mapping.get(p['championId'], "Unknown")
+                        async for page in self._match_detail_pages(custom_match_ids[:50], region):
+                            with self.manual_storage.batch():  # One save per fetched page
+                                for match_id, match_details in page:
+                                    if not match_details:
+                                        continue
+                                    
+                                    queue_id = match_details['info']['queueId']
+                                    # ONLY detect true custom/tournament games
+                                    # Queue 0 = Custom, Queue 2000-2020 = Tournament codes
+                                    # Excludes Clash, Arena, ARURF, and other RGMs
+                                    game_type = CUSTOM_IMPORT_GAME_TYPES.get(queue_id)
+                                    if game_type is None:
+                                        continue
+                                    
+                                    # Auto-add for all registered players in game
+                                    for p in match_details['info']['participants']:
+                                        p_riot_id = self._match_registered_player(p, registered_by_name)
+                                        is_registered = p_riot_id is not None
                                         
-                                        if queue_id == 0:
-                                            game_type = "custom"
-                                        elif 2000 <= queue_id <= 2020:
-                                            game_type = "tournament"
-                                        else:
-                                            game_type = "custom"  # Fallback
-                                        
-                                        match = ManualMatch(
-                                            match_id=p_match_id,
-                                            summoner_name=p_riot_id,
-                                            champion_name=p_champion,
-                                            result="WIN" if p['win'] else "LOSS",
-                                            kills=float(p['kills']),
-                                            deaths=float(p['deaths']),
-                                            assists=float(p['assists']),
-                                            cs=float(p['totalMinionsKilled'] + p['neutralMinionsKilled']),
-                                            game_duration=int(match_details['info']['gameDuration'] / 60),
-                                            queue_type=game_type,
-                                            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                            notes=f"Team sync"
-                                        )
-                                        if self.manual_storage.add_match(match):
-                                            if p_riot_id == riot_id:
-                                                custom_synced += 1
+                                        if is_registered:
+                                            p_match_id = f"CUSTOM_{match_id}_{p_riot_id}"
+                                            if not self.manual_storage.has_match(p_match_id):
+                                                p_champion = champion_mapping.get(p['championId'], "Unknown")
+                                                
+                                                match = ManualMatch.from_participant(
+                                                    p, p_match_id, p_riot_id, p_champion,
+                                                    game_duration_seconds=match_details['info']['gameDuration'],
+                                                    queue_type=game_type,
+                                                    date=import_date,
+                                                    notes="Team sync"
+                                                )
+                                                if self.manual_storage.add_match(match):
+                                                    if p_riot_id == riot_id:
+                                                        custom_synced += 1
                     
                     total_custom_imported += custom_synced
                     players_updated += 1
                     
-                    # Send success message (try edit first, fallback to new message)
-                    success_msg = f"✅ {riot_id}: {ranked_synced} ranked + {custom_synced} custom games"
-                    if status_msg:
-                        try:
-                            await status_msg.edit(content=success_msg)
-                        except Exception as edit_error:
-                            # Connection reset, send new message instead
-                            try:
-                                await ctx.send(success_msg)
-                            except:
-                                pass  # Discord is having issues, continue anyway
+                    progress_lines.append(f"✅ {riot_id}: {ranked_synced} ranked + {custom_synced} custom games")
+                    await update_status()
                     
                     # Add delay between players to prevent rate limiting
                     await asyncio.sleep(0.5)
@@ -2859,23 +2857,18 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                     error_msg = str(e)[:100]
                     errors_encountered.append(f"{riot_id}: {error_msg}")
                     
-                    # Try to send error message
-                    error_display = f"❌ Error syncing {riot_id}"
-                    if status_msg:
-                        try:
-                            await status_msg.edit(content=error_display)
-                        except:
-                            try:
-                                await ctx.send(error_display)
-                            except:
-                                pass  # Connection issues, continue to next player
+                    progress_lines.append(f"❌ Error syncing {riot_id}")
+                    await update_status()
+            
+            # Show the last per-player lines that were coalesced away
+            await progress.flush()
             
             # Final summary - always send this, even if connection was reset
             try:
                 final_embed = discord.Embed(
                     title=f"✅ Team Sync Complete: {team_name}",
                     description=f"Synced **{players_updated}** of **{total_players}** players",
-                    color=0x00ff00
+                    color=COLOR_GREEN
                 )
                 final_embed.add_field(name="Players updated", value=str(players_updated), inline=True)
                 final_embed.add_field(name="Total ranked imported", value=str(total_ranked_imported), inline=True)
@@ -2903,6 +2896,37 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 except:
                     pass  # Discord connection completely lost, data is saved anyway
     
+    def _ranked_stats_from_account(self, account):
+        """The ranked_stats entry stored in team data for a scraped account
+
+        Champions keep the account's order, already sorted by games played when the account was scraped
+        """
+        return {
+            "summoner_name": account.summoner_name,
+            "level": account.level,
+            "rank": {
+                "soloq": account.soloq_rank,
+                "flex": account.flex_rank,
+                "soloq_lp": account.soloq_lp,
+                "flex_lp": account.flex_lp
+            },
+            "champions": [
+                {
+                    "name": perf.champion_name,
+                    "games": perf.games_played,
+                    "wins": perf.wins,
+                    "losses": perf.losses,
+                    "win_rate": perf.win_rate,
+                    "kda": perf.kda,
+                    "kills": perf.kills,
+                    "deaths": perf.deaths,
+                    "assists": perf.assists,
+                    "cs_per_min": perf.cs_per_min
+                }
+                for perf in account.champion_performances
+            ]
+        }
+    
     def _combine_stats(self, ranked_stats, manual_matches):
         """Combine ranked and manual stats per champion"""
         combined = {}
@@ -2921,11 +2945,12 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                     "total_cs": champ["cs_per_min"] * champ["games"] * 25  # Approximate
                 }
         
-        # Add manual stats
+        # Add manual stats (one dict lookup per match, then update the entry in place)
         for match in manual_matches:
             champ_name = match.champion_name
-            if champ_name not in combined:
-                combined[champ_name] = {
+            data = combined.get(champ_name)
+            if data is None:
+                data = combined[champ_name] = {
                     "name": champ_name,
                     "games": 0,
                     "wins": 0,
@@ -2936,15 +2961,15 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                     "total_cs": 0
                 }
             
-            combined[champ_name]["games"] += 1
+            data["games"] += 1
             if match.result == "WIN":
-                combined[champ_name]["wins"] += 1
+                data["wins"] += 1
             else:
-                combined[champ_name]["losses"] += 1
-            combined[champ_name]["kills"] += match.kills
-            combined[champ_name]["deaths"] += match.deaths
-            combined[champ_name]["assists"] += match.assists
-            combined[champ_name]["total_cs"] += match.cs
+                data["losses"] += 1
+            data["kills"] += match.kills
+            data["deaths"] += match.deaths
+            data["assists"] += match.assists
+            data["total_cs"] += match.cs
         
         # Calculate averages and win rates
         result = []
@@ -2970,98 +2995,169 @@ Custom: `!syncteam MainRoster 50 100` (sync all players!)
                 })
         
         # Sort by games played
-        result.sort(key=lambda x: x["games"], reverse=True)
+        result.sort(key=itemgetter("games"), reverse=True)
         return result
     
     def _get_stats_from_matches(self, matches):
         """Calculate stats from a list of matches"""
-        if not matches:
-            return []
+        # Same aggregation as _combine_stats, just without ranked API stats
+        return self._combine_stats(None, matches)
+    
+    def _team_roster_stats(self, roster_snapshot):
+        """Combined totals per registered roster player (runs on the worker pool)
+
+        Takes (riot_id, ranked_stats, manual_matches) copies made on the event loop, never reads team_data itself.
+        Returns (riot_id, games, wins, ranked_games, custom_games) tuples, games/wins are None when the player has no stats
+        """
+        roster = []
+        for riot_id, ranked_stats, manual_matches in roster_snapshot:
+            # Count ranked games
+            ranked_game_count = 0
+            if ranked_stats and ranked_stats.get("champions"):
+                for champ in ranked_stats["champions"]:
+                    ranked_game_count += champ.get("games", 0)
+            
+            # Count custom/tournament games
+            custom_game_count = sum(1 for m in manual_matches if m.queue_type in ROSTER_CUSTOM_QUEUE_TYPES)
+            
+            combined = self._combine_stats(ranked_stats, manual_matches)
+            if combined:
+                player_games, player_wins = self._sum_games_and_wins(combined)
+                roster.append((riot_id, player_games, player_wins, ranked_game_count, custom_game_count))
+            else:
+                roster.append((riot_id, None, None, ranked_game_count, custom_game_count))
+        return roster
+    
+    def _build_stats_sections(self, ranked_stats, manual_matches):
+        """Aggregate and format the ranked/custom/combined !stats sections (runs on a worker thread)
+
+        Returns (top ranked champion names, ranked text, custom text, combined text), texts are None when empty
+        """
+        # Separate manual matches by type (single pass)
+        ranked_manual_matches = []
+        custom_matches = []
+        for m in manual_matches:
+            if m.queue_type in RANKED_QUEUE_TYPES:
+                ranked_manual_matches.append(m)
+            elif m.queue_type in CUSTOM_QUEUE_TYPES:
+                custom_matches.append(m)
         
-        champions = {}
+        # Ranked stats = ranked_stats from API + ranked games from manual storage
+        ranked_stats_combined = self._combine_stats(ranked_stats, ranked_manual_matches)
         
-        for match in matches:
-            champ_name = match.champion_name
-            if champ_name not in champions:
-                champions[champ_name] = {
-                    "name": champ_name,
-                    "games": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "kills": 0,
-                    "deaths": 0,
-                    "assists": 0,
-                    "total_cs": 0
-                }
-            
-            champions[champ_name]["games"] += 1
-            if match.result == "WIN":
-                champions[champ_name]["wins"] += 1
+        # Custom stats = only custom/tournament games
+        custom_stats = self._get_stats_from_matches(custom_matches)
+        
+        # Combined = everything
+        combined_stats = self._combine_stats(ranked_stats, manual_matches)
+        
+        texts = []
+        for stats in (ranked_stats_combined, custom_stats, combined_stats):
+            if stats:
+                total_games, total_wins = self._sum_games_and_wins(stats)
+                texts.append(self._format_champion_section(stats, total_games, total_wins))
             else:
-                champions[champ_name]["losses"] += 1
-            champions[champ_name]["kills"] += match.kills
-            champions[champ_name]["deaths"] += match.deaths
-            champions[champ_name]["assists"] += match.assists
-            champions[champ_name]["total_cs"] += match.cs
+                texts.append(None)
         
-        # Calculate averages
-        result = []
-        for champ_name, data in champions.items():
-            games = data["games"]
-            if games > 0:
-                kda = (data["kills"] + data["assists"]) / max(data["deaths"], 1)
-                win_rate = (data["wins"] / games) * 100
-                
-                result.append({
-                    "name": champ_name,
-                    "games": games,
-                    "wins": data["wins"],
-                    "losses": data["losses"],
-                    "win_rate": win_rate,
-                    "kda": kda,
-                    "kills": data["kills"] / games,
-                    "deaths": data["deaths"] / games,
-                    "assists": data["assists"] / games
-                })
+        top_champs = [c['name'] for c in ranked_stats_combined[:2]]
+        return (top_champs, *texts)
+    
+    def _format_champion_section(self, stats, total_games: int, total_wins: int, limit: int = 5) -> str:
+        """Build the overall line plus top champion rows for a !stats section"""
+        win_rate = (total_wins / total_games * 100) if total_games > 0 else 0
+        lines = [f"**Overall:** {total_games}g | {win_rate:.1f}% WR | **{total_wins}W** {total_games - total_wins}L\n"]
         
-        # Sort by games played
-        result.sort(key=lambda x: x["games"], reverse=True)
-        return result
+        for i, champ in enumerate(stats[:limit], 1):
+            # Add visual indicators
+            wr_emoji = WR_EMOJI[champ['win_rate'] >= 50]
+            kda = champ['kda']
+            kda_emoji = KDA_EMOJI[(kda >= 2.0) + (kda >= 3.0)]
+            
+            # Add clickable champion icon link
+            champ_icon = champion_icon_url(champ['name'])
+            champ_name_display = f"[{champ['name']}]({champ_icon})" if champ_icon else f"**{champ['name']}**"
+            
+            lines.append(f"{wr_emoji} {i}. {champ_name_display} - {champ['games']}g | {champ['win_rate']:.1f}% WR | {champ['kda']:.2f} KDA {kda_emoji}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def _registered_name_index(self):
+        """Map lowercase game names (tag stripped) to registered Riot IDs, built once per command"""
+        index = {}
+        for registered_id in self.team_data["players"]:
+            index.setdefault(registered_id.split('#')[0].lower(), registered_id)
+        return index
+    
+    def _match_registered_player(self, participant, registered_by_name):
+        """Return the registered Riot ID for a match participant, or None if they aren't registered"""
+        game_name = participant.get('riotIdGameName', participant.get('summonerName', ''))
+        tag = participant.get('riotIdTagline', '')
+        riot_id = f"{game_name}#{tag}" if tag else game_name
+        if riot_id in self.team_data["players"]:
+            return riot_id
+        return registered_by_name.get(game_name.lower())
+    
+    def _join_lines(self, lines, limit: int = 4000) -> str:
+        """Join lines for an embed description, cutting off whole lines past Discord's limit"""
+        text = "\n".join(lines)
+        if len(text) <= limit:
+            return text
+        
+        kept = []
+        size = 0
+        for line in lines:
+            if size + len(line) + 1 > limit - 30:
+                break
+            kept.append(line)
+            size += len(line) + 1
+        kept.append(f"...and {len(lines) - len(kept)} more")
+        return "\n".join(kept)
+    
+    def _sum_games_and_wins(self, stats):
+        """Total games and wins over a list of champion stats in one pass"""
+        total_games = 0
+        total_wins = 0
+        for champ in stats:
+            total_games += champ['games']
+            total_wins += champ['wins']
+        return total_games, total_wins
     
     def _tier_color(self, tier: str):
         """Get color based on tier"""
-        colors = {
-            "S": 0xffd700,  # Gold
-            "A": 0x00ff00,  # Green
-            "B": 0x3498db,  # Blue
-            "C": 0xff6b35,  # Orange
-            "D": 0xe74c3c   # Red
-        }
-        return colors.get(tier[0], 0x95a5a6)
+        return TIER_COLORS.get(tier[0], COLOR_GREY)
     
     def _matchup_color(self, win_rate: float):
         """Get color based on matchup win rate"""
-        if win_rate >= 55:
-            return 0x00ff00  # Green
-        elif win_rate >= 50:
-            return 0x3498db  # Blue
-        elif win_rate >= 45:
-            return 0xff6b35  # Orange
-        else:
-            return 0xe74c3c  # Red
+        return MATCHUP_COLORS[bisect_right(MATCHUP_WR_THRESHOLDS, win_rate)]
     
     def run(self):
         """Run the Discord bot"""
         if not self.token:
-            print("❌ DISCORD_BOT_TOKEN not found in environment variables!")
-            print("Create a .env file with: DISCORD_BOT_TOKEN=your_bot_token")
+            logger.error("❌ DISCORD_BOT_TOKEN not found in environment variables!")
+            logger.error("Create a .env file with: DISCORD_BOT_TOKEN=your_bot_token")
             return
         
-        print("🚀 Starting ScoutLE Discord Bot...")
-        print(f"📊 Riot API Key: {'✅ Set' if self.riot_api_key else '❌ Not set'}")
-        print(f"📝 Manual matches loaded: {len(self.manual_storage.matches)}")
-        self.bot.run(self.token)
+        logger.info("🚀 Starting ScoutLE Discord Bot...")
+        logger.info("📊 Riot API Key: %s", "✅ Set" if self.riot_api_key else "❌ Not set")
+        # Read manual matches in the background while the Discord connection is set up
+        self.executor.submit(self.manual_storage.preload)
+        # Expired disk cache entries are never read again, clear them out so the cache dir stays bounded
+        for prune in (self._account_disk_cache.prune, self._champ_disk_cache.prune, self.riot_scraper.prune_caches):
+            self.executor.submit(prune)
+        try:
+            self.bot.run(self.token)
+        finally:
+            self.executor.shutdown(wait=False)
+            self.io_executor.shutdown(wait=True)  # Flush pending saves before exiting
+
+def setup_logging():
+    """Send log records to stdout (level from SCOUTLE_LOG_LEVEL, default INFO)"""
+    logging.basicConfig(
+        level=os.getenv('SCOUTLE_LOG_LEVEL', 'INFO').upper(),
+        format='%(message)s'
+    )
 
 if __name__ == "__main__":
+    setup_logging()
     bot = ScoutLEBot()
     bot.run()
@@ -0,0 +1,130 @@
+"""
+Scraper Cache
+In-memory and disk-backed caches so the bot doesn't re-scrape the same data
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv('SCOUTLE_CACHE_DIR', Path.home() / '.cache' / 'scoutle'))
+
+class TTLCache:
+    """Thread-safe in-memory cache with a per-entry TTL and a size cap (least recently used evicted first)"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        """Store value for key, evicting the oldest entries past maxsize"""
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+@lru_cache(maxsize=1024)
+def _key_digest(key) -> str:
+    """File name for a cache key, hashed once per key instead of on every get/set"""
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+class DiskCache:
+    """Pickle-backed cache with an mtime based TTL, one file per key"""
+
+    def __init__(self, namespace: str, ttl: float, cache_dir: Optional[Path] = None):
+        self.ttl = ttl
+        self.directory = Path(cache_dir or DEFAULT_CACHE_DIR) / namespace
+
+    def _path(self, key) -> Path:
+        return self.directory / f"{_key_digest(key)}.pkl"
+
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                self._discard(path)  # Drop it now rather than leaving stale files to pile up
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Corrupt or outdated entry (e.g. dataclass changed), treat as a miss
+            logger.warning("⚠️ Ignoring unreadable cache entry %s: %s", path.name, e)
+            return None
+
+    def set(self, key, value):
+        """Store value for key (written to a temp file first so readers never see partial data)"""
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("⚠️ Could not write cache entry: %s", e)
+
+    def _discard(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """Remove expired entries in this namespace, returns how many were removed"""
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for path in self.directory.glob('*.pkl'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self):
+        """Remove every entry in this namespace"""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob('*.pkl'):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -57,8 +57,9 @@ def main():
     
     try:
         print("🚀 Starting ScoutLE Discord Bot...")
-        from scoutle_discord_bot import ScoutLEBot
+        from scoutle_discord_bot import ScoutLEBot, setup_logging
         
+        setup_logging()
         bot = ScoutLEBot()
         bot.run()
         